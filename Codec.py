@@ -0,0 +1,174 @@
+import binascii # Hex folding for the decoder
+import csv # Text.BIN is a CSV lookup table
+import os
+import time # Benchmark timing
+
+TEXT_BIN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Text.BIN")
+
+
+class AsciiBinaryCodec:
+    """
+    Encodes text to the human-readable 8-bit binary view ('01010000 01001100 ...') and back.
+    The 256-entry ASCII/binary table is built once from Text.BIN; whole buffers are then
+    converted with bytes.translate and extended-slice copies (encode) or the hex codec (decode)
+    instead of per-character format()/int().
+    """
+    def __init__(self, table_path=TEXT_BIN_PATH):
+        self.table = [format(code, "08b") for code in range(256)]
+        self._load_text_bin(table_path)
+
+        # One translate table per bit position: byte value -> b'0' or b'1'
+        self._bit_tables = [
+            bytes(ord(self.table[code][bit]) for code in range(256)) for bit in range(8)
+        ]
+        # Decoding reads the view as hex: '01010000' is the bytes 01 01 00 00. Each byte holds
+        # two bits (0x00/0x01/0x10/0x11), is renamed to the hex digit of their value and folded
+        # again, giving four bits per byte (0x00..0x33), then once more to the full byte.
+        # Anything else maps to 'x', which unhexlify rejects.
+        pair_table, quad_table = bytearray(b"x") * 256, bytearray(b"x") * 256
+        for value in range(4):
+            pair_table[(value >> 1) * 16 + (value & 1)] = ord(format(value, "x"))
+            for low in range(4):
+                quad_table[value * 16 + low] = ord(format(value * 4 + low, "x"))
+        self._pair_table, self._quad_table = bytes(pair_table), bytes(quad_table)
+
+    def _load_text_bin(self, table_path):
+        """Reads the Term/ASCII/Binary rows of Text.BIN and checks them against the table."""
+        if not os.path.exists(table_path):
+            return
+        with open(table_path, newline="", encoding="utf-8") as handle:
+            for row in csv.reader(handle):
+                if len(row) < 3 or not row[1].strip().isdigit():
+                    continue # Header and blank separator rows
+                term, code, binary = row[0], int(row[1]), row[2].strip()
+                if len(term) != 1 or ord(term) != code or self.table[code] != binary:
+                    raise ValueError(f"Text.BIN entry {row} disagrees with 8-bit ASCII.")
+                self.table[code] = binary
+
+    # --- Whole-buffer conversion ---
+    def _encode_view(self, data):
+        """Builds the binary view in a bytearray: one translate + one strided copy per bit position."""
+        count = len(data)
+        view = bytearray(9 * count)
+        for bit, bit_table in enumerate(self._bit_tables):
+            view[bit::9] = data.translate(bit_table)
+        view[8::9] = b" " * count
+        del view[-1:] # No separator after the last group
+        return view
+
+    def encode(self, data):
+        """Encodes bytes (or Latin-1 text) to the space-separated binary view as ASCII bytes."""
+        if isinstance(data, str):
+            data = data.encode("latin-1")
+        return bytes(self._encode_view(data))
+
+    def decode(self, binary):
+        """Decodes a space-separated binary view back to bytes."""
+        if isinstance(binary, (bytes, bytearray)):
+            binary = binary.decode("ascii")
+        if not binary:
+            return b""
+        count = (len(binary) + 1) // 9
+        if (len(binary) + 1) % 9 or binary[8::9].count(" ") != count - 1:
+            raise ValueError("Binary view must be 8-bit groups separated by single spaces.")
+
+        try:
+            pairs = bytes.fromhex(binary).translate(self._pair_table)
+            decoded = binascii.unhexlify(binascii.unhexlify(pairs).translate(self._quad_table))
+        except ValueError: # binascii.Error is a ValueError too
+            decoded = None
+        if decoded is None or len(decoded) != count: # Stray whitespace inside a group shortens the output
+            raise ValueError("Binary view contains characters other than 0 and 1.")
+        return decoded
+
+    # --- Drop-in replacements for the per-character helpers ---
+    def text_to_binary(self, text):
+        """Same output as the original text_to_binary, vectorized for Latin-1 text."""
+        try:
+            return self._encode_view(text.encode("latin-1")).decode("ascii")
+        except UnicodeEncodeError:
+            return ' '.join(format(ord(char), '08b') for char in text) # Wider code points keep the old path
+
+    def binary_to_text(self, binary_fragment):
+        """Same output as the original binary_to_text for well-formed binary views."""
+        try:
+            return self.decode(binary_fragment).decode("latin-1")
+        except ValueError:
+            # Groups wider than 8 bits come from text_to_binary's fallback for non-Latin-1 text
+            return ''.join(chr(int(group, 2)) for group in binary_fragment.split())
+
+    # --- Streaming ---
+    def encode_stream(self, chunks):
+        """Yields the binary view of a stream of byte chunks without joining the whole stream."""
+        first = True
+        for chunk in chunks:
+            if not chunk:
+                continue
+            encoded = self.encode(chunk)
+            yield encoded if first else b" " + encoded
+            first = False
+
+    def decode_stream(self, chunks):
+        """Yields decoded bytes from a stream of binary-view chunks split at arbitrary points."""
+        pending = b""
+        for chunk in chunks:
+            pending += chunk.encode("ascii") if isinstance(chunk, str) else chunk
+            whole = len(pending) // 9 * 9 # Complete 'xxxxxxxx ' groups
+            if whole:
+                yield self.decode(pending[:whole - 1])
+                pending = pending[whole:]
+        if pending:
+            yield self.decode(pending)
+
+
+_default_codec = None
+
+
+def get_codec():
+    """Returns the shared codec, loading Text.BIN on first use only."""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = AsciiBinaryCodec()
+    return _default_codec
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    def legacy_text_to_binary(text):
+        return ' '.join(format(ord(char), '08b') for char in text)
+
+    def legacy_binary_to_text(binary_fragment):
+        return ''.join(chr(int(binary_fragment[i:i+8], 2)) for i in range(0, len(binary_fragment), 9) if binary_fragment[i:i+8])
+
+    codec = get_codec()
+    print(f"🚀 Loaded ASCII/binary table from Text.BIN: 'P' -> {codec.table[ord('P')]}")
+
+    # 1. Round trip and compatibility with the original helpers
+    teddy_log_content = "LOG_START. Server (teddy_server) received command: Connect. Status: OK. Disconnect."
+    assert codec.text_to_binary(teddy_log_content) == legacy_text_to_binary(teddy_log_content)
+    assert codec.binary_to_text(legacy_text_to_binary(teddy_log_content)) == teddy_log_content
+    assert codec.binary_to_text(codec.text_to_binary("Status: OK ✓")) == "Status: OK ✓" # Non-Latin-1 round trip
+    streamed = b"".join(codec.decode_stream(
+        piece for piece in (lambda view: [view[i:i + 1000] for i in range(0, len(view), 1000)])(
+            b"".join(codec.encode_stream([teddy_log_content.encode("ascii")] * 50)))))
+    assert streamed.decode("ascii") == teddy_log_content * 50
+
+    # 2. Benchmark against the per-character functions
+    text = teddy_log_content * 12000 # ~1 MB
+    print(f"\n--- Benchmark: {len(text):,} characters ---")
+    for label, legacy, fast, argument in (
+        ("encode", legacy_text_to_binary, codec.text_to_binary, text),
+        ("decode", legacy_binary_to_text, codec.binary_to_text, legacy_text_to_binary(text)),
+    ):
+        legacy_seconds = fast_seconds = float("inf")
+        for _ in range(3): # Best of three runs
+            start = time.perf_counter()
+            expected = legacy(argument)
+            legacy_seconds = min(legacy_seconds, time.perf_counter() - start)
+            start = time.perf_counter()
+            result = fast(argument)
+            fast_seconds = min(fast_seconds, time.perf_counter() - start)
+        assert result == expected
+        print(f"| {label:<6} | legacy {legacy_seconds * 1000:8.1f} ms | codec {fast_seconds * 1000:7.1f} ms "
+              f"| {legacy_seconds / fast_seconds:6.1f}x faster")
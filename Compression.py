@@ -0,0 +1,220 @@
+import lzma # Slower, higher-ratio codec for cold/archival data
+import time # CPU cost accounting
+import zlib # Fast default codec
+from bisect import bisect # Free extents are kept sorted by start sector
+
+from Codec import get_codec # Whole-buffer binary view conversion
+
+CODECS = {
+    "none": (lambda data: data, lambda data: data),
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive with transparent per-extent compression of sector payloads.
+    Files are split into extents; each extent is compressed with the codec selected for
+    its file or directory, or stored raw when it does not compress.
+    """
+    def __init__(self, capacity_gb, sector_size=512, extent_size=64 * 1024,
+                 min_savings=0.10, skip_after=4, probe_every=16):
+        self.capacity = capacity_gb
+        self.sector_size = sector_size
+        self.extent_size = extent_size
+        self.data_blocks = {}
+        self.file_allocation_table = {} # filename -> [(start_sector, sector_count, codec, raw_len, stored_len)]
+        self.next_free_sector = 1
+        self.free_extents = [] # Sorted (start_sector, sector_count) runs released by rewrites
+        self.compression_policy = {} # path prefix -> codec name
+
+        # Adaptive skipping: after 'skip_after' incompressible extents in a row, only every
+        # 'probe_every'-th extent of that file is tried again
+        self.min_savings = min_savings
+        self.skip_after = skip_after
+        self.probe_every = probe_every
+
+        self.stats = {"raw_bytes": 0, "stored_bytes": 0, "attempted_bytes": 0, "compress_seconds": 0.0,
+                      "decompress_seconds": 0.0, "extents": 0, "compressed_extents": 0,
+                      "incompressible_extents": 0, "skipped_extents": 0}
+        print(f"======================================================")
+        print(f"🚀 Initializing Planet Disk with Transparent Compression.")
+        print(f"======================================================")
+
+    def text_to_binary(self, text):
+        """Converts a string to its 8-bit ASCII binary representation (human-readable view only)."""
+        return get_codec().text_to_binary(text)
+
+    def write_data(self, sector, payload, status="[WRITE]"):
+        """Writes raw bytes to a sector."""
+        self.data_blocks[sector] = payload
+        self.next_free_sector = max(self.next_free_sector, sector + 1)
+
+    def read_sector(self, sector):
+        """Reads raw bytes from a sector."""
+        return self.data_blocks.get(sector, b"")
+
+    # --- NEW COMPRESSION METHODS ---
+    def set_compression(self, path, codec):
+        """Selects a codec ('none', 'zlib' or 'lzma') for a file or every file below a directory."""
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}'; choose one of {sorted(CODECS)}.")
+        self.compression_policy[path.rstrip("/")] = codec
+        print(f"🗜️ Compression policy: {path} -> {codec}")
+
+    def codec_for(self, filename):
+        """Resolves the codec for a file from the most specific matching policy entry."""
+        path = filename
+        while True:
+            if path in self.compression_policy:
+                return self.compression_policy[path]
+            if "/" not in path:
+                return "none"
+            path = path.rsplit("/", 1)[0]
+
+    def _allocate_run(self, sector_count):
+        """First-fit over the released runs, falling back to fresh sectors past next_free_sector."""
+        for index, (start_sector, free_count) in enumerate(self.free_extents):
+            if free_count >= sector_count:
+                if free_count == sector_count:
+                    del self.free_extents[index]
+                else:
+                    self.free_extents[index] = (start_sector + sector_count, free_count - sector_count)
+                return start_sector
+        start_sector = self.next_free_sector
+        self.next_free_sector = start_sector + sector_count
+        return start_sector
+
+    def _release_extents(self, extents):
+        """Frees the sectors of replaced extents, merging each run with its free neighbours."""
+        for start_sector, sector_count, *_ in extents:
+            for sector in range(start_sector, start_sector + sector_count):
+                self.data_blocks.pop(sector, None)
+            index = bisect(self.free_extents, (start_sector, sector_count))
+            if index < len(self.free_extents) and self.free_extents[index][0] == start_sector + sector_count:
+                sector_count += self.free_extents.pop(index)[1]
+            if index and sum(self.free_extents[index - 1]) == start_sector:
+                index -= 1
+                start_sector, previous_count = self.free_extents.pop(index)
+                sector_count += previous_count
+            self.free_extents.insert(index, (start_sector, sector_count))
+
+    def _store_extent(self, payload):
+        """Writes one (possibly compressed) extent to contiguous sectors and returns its start."""
+        sector_count = max(1, -(-len(payload) // self.sector_size))
+        start_sector = self._allocate_run(sector_count)
+        for i in range(0, max(len(payload), 1), self.sector_size):
+            self.write_data(start_sector + i // self.sector_size, payload[i:i + self.sector_size])
+        return start_sector, sector_count
+
+    def write_file(self, filename, content):
+        """Splits a file into extents, compresses each one that pays off, and records the extent map."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        codec = self.codec_for(filename)
+        compress = CODECS[codec][0]
+        extents = []
+        incompressible_run = 0
+
+        for index, offset in enumerate(range(0, max(len(data), 1), self.extent_size)):
+            raw = data[offset:offset + self.extent_size]
+            stored, used_codec = raw, "none"
+
+            probing = incompressible_run < self.skip_after or index % self.probe_every == 0
+            if codec != "none" and probing:
+                start = time.process_time()
+                candidate = compress(raw)
+                self.stats["compress_seconds"] += time.process_time() - start
+                self.stats["attempted_bytes"] += len(raw)
+                if len(candidate) <= len(raw) * (1 - self.min_savings):
+                    stored, used_codec = candidate, codec
+                    incompressible_run = 0
+                    self.stats["compressed_extents"] += 1
+                else:
+                    incompressible_run += 1
+                    self.stats["incompressible_extents"] += 1
+            elif codec != "none":
+                self.stats["skipped_extents"] += 1
+
+            start_sector, sector_count = self._store_extent(stored)
+            extents.append((start_sector, sector_count, used_codec, len(raw), len(stored)))
+            self.stats["raw_bytes"] += len(raw)
+            self.stats["stored_bytes"] += len(stored)
+            self.stats["extents"] += 1
+
+        # The new extents are in place before the old ones are released
+        self._release_extents(self.file_allocation_table.get(filename, []))
+        self.file_allocation_table[filename] = extents
+        raw_total = sum(extent[3] for extent in extents)
+        stored_total = sum(extent[4] for extent in extents)
+        print(f"💾 [{codec.upper()} WRITE] {filename}: {raw_total:,} bytes -> {stored_total:,} bytes "
+              f"in {len(extents)} extent(s)")
+        return extents
+
+    def read_file(self, filename):
+        """Reads a file back, transparently decompressing each extent."""
+        if filename not in self.file_allocation_table:
+            print(f"\n❌ Error: File '{filename}' not found on disk.")
+            return None
+        parts = []
+        for start_sector, sector_count, codec, raw_length, stored_length in self.file_allocation_table[filename]:
+            stored = b"".join(self.read_sector(start_sector + i) for i in range(sector_count))[:stored_length]
+            start = time.process_time()
+            parts.append(CODECS[codec][1](stored))
+            self.stats["decompress_seconds"] += time.process_time() - start
+        return b"".join(parts)
+
+    def read_file_binary(self, filename):
+        """Human-readable binary view of a file, rendered on read instead of stored 9x expanded."""
+        data = self.read_file(filename)
+        return None if data is None else self.text_to_binary(data.decode("utf-8", errors="replace"))
+
+    def compression_report(self):
+        """Prints the overall compression ratio and the CPU spent to get it."""
+        stats = self.stats
+        ratio = stats["raw_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 1.0
+        attempted_mb = stats["attempted_bytes"] / (1024 * 1024)
+        print(f"\n--- COMPRESSION REPORT ---")
+        print(f"| {'Logical bytes':<28} | {stats['raw_bytes']:,}")
+        print(f"| {'Stored bytes':<28} | {stats['stored_bytes']:,}")
+        print(f"| {'Compression ratio':<28} | {ratio:.2f}x")
+        print(f"| {'Extents (compressed/raw)':<28} | {stats['compressed_extents']}/{stats['incompressible_extents']}"
+              f" (+{stats['skipped_extents']} skipped without trying)")
+        print(f"| {'Compress CPU':<28} | {stats['compress_seconds'] * 1000:.1f} ms"
+              f" ({attempted_mb / stats['compress_seconds'] if stats['compress_seconds'] else 0:.1f} MB/s)")
+        print(f"| {'Decompress CPU':<28} | {stats['decompress_seconds'] * 1000:.1f} ms")
+        return dict(stats, ratio=ratio)
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    import os
+
+    my_disk = PlanetDiskHardDrive(capacity_gb=4000)
+
+    # 1. Choose codecs: fast zlib for hot logs, lzma for rarely-read install configuration
+    my_disk.set_compression("teddy_server/logs", "zlib")
+    my_disk.set_compression("C:/ProgramFiles/Teddy_Server/config", "lzma")
+    my_disk.set_compression("teddy_server/uploads", "zlib")
+
+    # 2. Log-heavy data compresses extremely well
+    teddy_log_content = "LOG_START. Server (teddy_server) received command: Connect. Status: OK. Disconnect.\n" * 20000
+    my_disk.write_file("teddy_server/logs/teddy_server_log.txt", teddy_log_content)
+    my_disk.write_file("C:/ProgramFiles/Teddy_Server/config/settings.ini",
+                       "// CONFIG: port=8080; database=production; version=1.0.0\n" * 100)
+
+    # 3. Already-compressed uploads are detected and stored raw, with later extents skipped
+    my_disk.write_file("teddy_server/uploads/archive.bin", os.urandom(2 * 1024 * 1024))
+
+    # 4. Reads are transparent
+    assert my_disk.read_file("teddy_server/logs/teddy_server_log.txt").decode("utf-8") == teddy_log_content
+    print(f"🔍 settings.ini binary view: {my_disk.read_file_binary('C:/ProgramFiles/Teddy_Server/config/settings.ini')[:53]}...")
+
+    # 5. Rewrites release the old extents, so repeated patches do not grow the disk
+    high_water = my_disk.next_free_sector
+    for patch in range(1, 11):
+        my_disk.write_file("C:/ProgramFiles/Teddy_Server/config/settings.ini",
+                           f"// CONFIG: port=8080; database=production; version=1.0.{patch}\n" * 100)
+    print(f"♻️ 10 rewrites of settings.ini grew the used region by {my_disk.next_free_sector - high_water} sector(s)")
+    my_disk.compression_report()
@@ -1,4 +1,77 @@
+import threading # Background read-ahead
 import time # To simulate the time taken for the defragmentation process
+from collections import OrderedDict # LRU sector cache
+from concurrent.futures import ThreadPoolExecutor # Single prefetch worker per disk
+
+from Codec import get_codec # Whole-buffer binary view conversion
+
+
+class ReadAheadHandle:
+    """
+    Sequential reader over one file. Detects sequential access per handle and prefetches
+    the next physically contiguous extent into the disk's sector cache. The read-ahead
+    window doubles on every sequential read and collapses back to the minimum on a jump.
+    """
+    def __init__(self, disk, filename, background=False, min_window=2, max_window=64):
+        self.disk = disk
+        self.filename = filename
+        self.chain = list(disk.file_allocation_table[filename])
+        self.background = background
+        self.min_window = min_window
+        self.max_window = max_window
+        self.window = min_window
+        self.position = 0
+        self._last_index = None
+        self._pending = None # (future, set of sectors being prefetched)
+
+    def seek(self, index):
+        """Moves the handle; the next read is treated as random access."""
+        self.position = index
+
+    def read(self):
+        """Returns the binary data of the next fragment, or None at end of file."""
+        if self.position >= len(self.chain):
+            return None
+        index = self.position
+        sequential = self._last_index is not None and index == self._last_index + 1
+        self.window = min(self.window * 2, self.max_window) if sequential else self.min_window
+
+        sector = self.chain[index]
+        data = self.disk.cached_read(sector)
+        if data is None and self._pending is not None and sector in self._pending[1]:
+            self._pending[0].result() # The prefetch is already in flight: wait for it
+            data = self.disk.cached_read(sector)
+        if data is None:
+            # Demand miss: read the whole contiguous run up to the window in one request
+            self.disk.stats["demand_misses"] += 1
+            run = self.disk.contiguous_run(self.chain, index, self.window)
+            data = self.disk.read_extent(sector, run)[0]
+        else:
+            self.disk.stats["cache_hits"] += 1
+
+        if sequential:
+            self._prefetch(index + 1)
+        self._last_index = index
+        self.position = index + 1
+        return data
+
+    def _prefetch(self, index):
+        """Schedules the next window-sized contiguous extent once less than half a window is buffered."""
+        ahead = index
+        while ahead < len(self.chain) and ahead < index + self.window and self.disk.is_cached(self.chain[ahead]):
+            ahead += 1
+        if ahead >= len(self.chain) or ahead - index >= self.window // 2:
+            return
+        if self._pending is not None and not self._pending[0].done():
+            return
+        run = self.disk.contiguous_run(self.chain, ahead, self.window)
+        start_sector = self.chain[ahead]
+        if self.background:
+            future = self.disk.prefetcher.submit(self.disk.read_extent, start_sector, run)
+            self._pending = (future, set(range(start_sector, start_sector + run)))
+        else:
+            self.disk.read_extent(start_sector, run)
+
 
 class PlanetDiskHardDrive:
     """
@@ -11,21 +84,34 @@ class PlanetDiskHardDrive:
         self.data_blocks = {}
         self.file_allocation_table = {} 
         self.next_free_sector = 1 # Keep track of where the next contiguous file should start
+        # Sector cache and simulated head mechanics for read-ahead
+        self.sector_cache = OrderedDict()
+        self.cache_capacity = 256
+        self.head_position = 0
+        self.seek_ms = 2.0            # Head movement to a non-adjacent sector
+        self.request_overhead_ms = 0.5 # Command overhead per device request
+        self.transfer_ms = 0.02       # Per-sector media transfer
+        self.stats = {"device_requests": 0, "seeks": 0, "cache_hits": 0, "demand_misses": 0}
+        self._device_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self.prefetcher = ThreadPoolExecutor(max_workers=1)
         print(f"🚀 Initializing {self.capacity}GB Planet Disk Hard Drive with {self.interface} interface.")
         print("-" * 45)
 
     def text_to_binary(self, text):
         """Converts a string to its 8-bit ASCII binary representation."""
-        return ' '.join(format(ord(char), '08b') for char in text)
+        return get_codec().text_to_binary(text)
 
     def binary_to_text(self, binary_fragment):
         """Converts a binary string fragment back to text."""
-        return ''.join(chr(int(binary_fragment[i:i+8], 2)) for i in range(0, len(binary_fragment), 9) if binary_fragment[i:i+8])
+        return get_codec().binary_to_text(binary_fragment)
 
     def write_data(self, sector, text_data, status="[CONTIGUOUS]"):
         """Simulates writing text data to a specific sector in binary."""
         binary_data = self.text_to_binary(text_data)
-        self.data_blocks[sector] = binary_data
+        with self._device_lock: # Never lands between a prefetch's media read and its cache fill
+            self.data_blocks[sector] = binary_data
+            self._invalidate(sector)
         print(f"💾 {status} Sector {sector}: '{text_data}' -> {binary_data[:17]}...")
 
     def read_sector(self, sector):
@@ -73,8 +159,10 @@ class PlanetDiskHardDrive:
         time.sleep(0.5) # Simulate processing time
         
         # 2. CLEAR OLD FRAGMENTS
-        for sector in old_sectors:
-            del self.data_blocks[sector]
+        with self._device_lock:
+            for sector in old_sectors:
+                del self.data_blocks[sector]
+                self._invalidate(sector)
         print(f"  ✅ Cleared old fragmented sectors: {old_sectors}")
         
         # 3. REWRITE CONTIGUOUSLY
@@ -97,6 +185,76 @@ class PlanetDiskHardDrive:
         self.next_free_sector = new_sector_chain[-1] + 1
 
 
+    # --- NEW READ-AHEAD METHODS ---
+    def _invalidate(self, sector):
+        with self._cache_lock:
+            self.sector_cache.pop(sector, None)
+
+    def is_cached(self, sector):
+        with self._cache_lock:
+            return sector in self.sector_cache
+
+    def cached_read(self, sector):
+        """Returns a sector from the cache (refreshing its LRU position) or None on a miss."""
+        with self._cache_lock:
+            if sector in self.sector_cache:
+                self.sector_cache.move_to_end(sector)
+                return self.sector_cache[sector]
+        return None
+
+    def read_extent(self, start_sector, count):
+        """
+        One device request for 'count' physically contiguous sectors. Pays a seek only when
+        the head is not already there; results are placed in the sector cache before the
+        device lock is released, so a concurrent write cannot leave a stale copy cached.
+        """
+        with self._device_lock:
+            cost_ms = self.request_overhead_ms + self.transfer_ms * count
+            if start_sector != self.head_position:
+                cost_ms += self.seek_ms
+                self.stats["seeks"] += 1
+            time.sleep(cost_ms / 1000)
+            self.head_position = start_sector + count
+            self.stats["device_requests"] += 1
+            data = [self.read_sector(start_sector + i) for i in range(count)]
+            with self._cache_lock:
+                for i, payload in enumerate(data):
+                    self.sector_cache[start_sector + i] = payload
+                    self.sector_cache.move_to_end(start_sector + i)
+                while len(self.sector_cache) > self.cache_capacity:
+                    self.sector_cache.popitem(last=False)
+        return data
+
+    def contiguous_run(self, chain, index, limit):
+        """Length of the physically contiguous run in 'chain' starting at 'index' (at most 'limit')."""
+        run = 1
+        while run < limit and index + run < len(chain) and chain[index + run] == chain[index] + run:
+            run += 1
+        return run
+
+    def open_file(self, filename, read_ahead=True, background=False):
+        """Opens a read handle; read_ahead=False reads one sector per device request."""
+        if read_ahead:
+            return ReadAheadHandle(self, filename, background=background)
+        return ReadAheadHandle(self, filename, min_window=1, max_window=1)
+
+    def benchmark_read(self, filename, read_ahead=True, background=False, work_ms=0.0):
+        """Reads a whole file through a handle and returns fragments per second."""
+        with self._cache_lock:
+            self.sector_cache.clear()
+        self.head_position = 0
+        for key in self.stats:
+            self.stats[key] = 0
+        handle = self.open_file(filename, read_ahead=read_ahead, background=background)
+        start = time.perf_counter()
+        fragments = 0
+        while handle.read() is not None:
+            fragments += 1
+            if work_ms:
+                time.sleep(work_ms / 1000) # Consumer processing between reads
+        elapsed = time.perf_counter() - start
+        return fragments / elapsed, dict(self.stats)
+
 # --- Hard-Coded Execution Block ---
 my_disk = PlanetDiskHardDrive(capacity_gb=4000)
 
@@ -119,3 +277,21 @@ my_disk.defragment_file(
 print("\n--- 🔍 Reading Defragmented File ---")
 sectors = my_disk.file_allocation_table["teddy_server_log.txt"]
 print(f"Data is now located in contiguous sectors: {sectors}")
+
+# 4. Read-ahead benchmark: fragmented vs. defragmented layout of the same file
+big_log_content = "LOG_LINE. teddy_server heartbeat OK. " * 60
+my_disk.write_fragmented_file(filename="big_log_fragmented.txt", content=big_log_content, fragment_size=10)
+my_disk.write_fragmented_file(filename="big_log.txt", content=big_log_content, fragment_size=10)
+my_disk.defragment_file(filename="big_log.txt", new_start_sector=my_disk.next_free_sector + 100)
+
+print("\n--- 📈 Read-Ahead Benchmark (fragments/second) ---")
+for label, filename, read_ahead, background in (
+    ("Fragmented, no read-ahead", "big_log_fragmented.txt", False, False),
+    ("Fragmented, read-ahead", "big_log_fragmented.txt", True, True),
+    ("Contiguous, no read-ahead", "big_log.txt", False, False),
+    ("Contiguous, read-ahead", "big_log.txt", True, False),
+    ("Contiguous, background read-ahead", "big_log.txt", True, True),
+):
+    throughput, stats = my_disk.benchmark_read(filename, read_ahead=read_ahead, background=background, work_ms=0.2)
+    print(f"| {label:<34} | {throughput:8.0f} frag/s | requests: {stats['device_requests']:<4} | seeks: {stats['seeks']}")
+my_disk.prefetcher.shutdown()
@@ -1,28 +1,144 @@
+import time # For showing that du-style queries do not grow with the tree
+
+
+class QuotaExceededError(OSError):
+    """An allocation would push a directory, an application or the disk past its limit."""
+
+
 class PlanetDiskHardDrive:
     """
-    Conceptual hard drive with directory creation functionality.
+    Conceptual hard drive with directory creation functionality and space accounting.
+    Every directory keeps a running count of the sectors in its subtree, and every
+    application keeps a count of the sectors it owns. Allocations update those counters on
+    all ancestors, so usage queries are single lookups. Quotas and the declared capacity
+    are enforced before any sector is handed out.
     """
+    SECTOR_SIZE = 512 # Characters of file payload per sector
+
     def __init__(self, capacity_gb):
         self.capacity = capacity_gb
+        self.capacity_sectors = capacity_gb * 1024 ** 3 // self.SECTOR_SIZE
         self.data_blocks = {}
-        self.file_allocation_table = {} 
-        self.next_free_sector = 1 
+        self.file_allocation_table = {}
+        self.next_free_sector = 1
+        self.free_sectors = [] # Sectors released by delete_path(), reused first
+
+        # --- Space Accounting ---
+        self.used_sectors = 0
+        self.subtree_usage = {} # Directory path -> sectors used by it and everything below it
+        self.app_usage = {}     # Application -> sectors owned
+        self.quotas = {}        # Directory path -> sector limit
+        self.app_quotas = {}    # Application -> sector limit
+        self._owner = {}        # FAT path -> owning application
         print(f"======================================================")
         print(f"🚀 Initializing Planet Disk for Directory Setup.")
         print(f"======================================================")
 
-    def write_data(self, sector, text_data, status="[WRITE]"):
+    def write_data(self, sector, text_data, status="[WRITE]", quiet=False):
         """Writes data to a sector."""
         # Simple binary representation is omitted for brevity in this step
-        self.data_blocks[sector] = text_data 
-        print(f"💾 {status} Sector {sector}: '{text_data[:60]}...'")
+        self.data_blocks[sector] = text_data
+        if not quiet:
+            print(f"💾 {status} Sector {sector}: '{text_data[:60]}...'")
         self.next_free_sector = max(self.next_free_sector, sector + 1)
 
     def read_sector(self, sector):
         """Reads data from a sector."""
         return self.data_blocks.get(sector, "RAW DATA ERROR")
 
-    def create_directory(self, directory_name):
+    # --- Space Accounting ---
+    @staticmethod
+    def _ancestors(path):
+        """'a/b/c.txt' -> 'a', 'a/b' (the directories whose subtree contains the path)."""
+        parts = path.split("/")
+        return ["/".join(parts[:i]) for i in range(1, len(parts))]
+
+    @staticmethod
+    def application_of(path):
+        """
+        C:/ProgramFiles/<App>/... belongs to <App>; the rest of C: (including C:/ProgramFiles
+        itself) to the system; anything else to its top-level directory.
+        """
+        parts = path.split("/")
+        if parts[0] == "C:":
+            return parts[2] if len(parts) > 2 and parts[1] == "ProgramFiles" else "(system)"
+        return parts[0]
+
+    def _charge(self, path, delta, owner, is_directory=False):
+        """
+        Applies a change of 'delta' sectors to the path's own counter (directories only), its
+        ancestors, its application and the disk. Limits are checked before anything changes,
+        so a failed allocation leaves every counter untouched. Ancestors that were never
+        created still get a counter, so creating them later keeps what is already below them.
+        """
+        is_directory = is_directory or path in self.subtree_usage
+        scopes = self._ancestors(path) + ([path] if is_directory else [])
+        if delta > 0:
+            if self.used_sectors + delta > self.capacity_sectors:
+                raise QuotaExceededError(f"Disk full: {delta} sector(s) requested, "
+                                         f"{self.capacity_sectors - self.used_sectors} free of {self.capacity} GB.")
+            for scope in scopes:
+                limit = self.quotas.get(scope)
+                if limit is not None and self.subtree_usage.get(scope, 0) + delta > limit:
+                    raise QuotaExceededError(f"Quota exceeded for '{scope}': "
+                                             f"{self.subtree_usage.get(scope, 0) + delta} > {limit} sectors.")
+            limit = self.app_quotas.get(owner)
+            if limit is not None and self.app_usage.get(owner, 0) + delta > limit:
+                raise QuotaExceededError(f"Quota exceeded for application '{owner}': "
+                                         f"{self.app_usage.get(owner, 0) + delta} > {limit} sectors.")
+        for scope in scopes:
+            self.subtree_usage[scope] = self.subtree_usage.get(scope, 0) + delta
+        self.app_usage[owner] = self.app_usage.get(owner, 0) + delta
+        self.used_sectors += delta
+
+    def _allocate_sectors(self, count):
+        """Hands out 'count' sectors, reusing freed ones before growing the disk."""
+        sectors = []
+        while self.free_sectors and len(sectors) < count:
+            sectors.append(self.free_sectors.pop())
+        start = self.next_free_sector
+        sectors.extend(range(start, start + count - len(sectors)))
+        return sorted(sectors)
+
+    def set_quota(self, directory_name, limit_bytes):
+        """Limits the space a directory subtree may use (None removes the quota)."""
+        self.quotas.pop(directory_name, None)
+        if limit_bytes is not None:
+            self.quotas[directory_name] = -(-limit_bytes // self.SECTOR_SIZE)
+        print(f"📏 Quota for '{directory_name}': {limit_bytes if limit_bytes is not None else '∞'} bytes")
+
+    def set_app_quota(self, app_name, limit_bytes):
+        """Limits the space an application may own across the whole disk (None removes the quota)."""
+        self.app_quotas.pop(app_name, None)
+        if limit_bytes is not None:
+            self.app_quotas[app_name] = -(-limit_bytes // self.SECTOR_SIZE)
+        print(f"📏 Quota for application '{app_name}': {limit_bytes if limit_bytes is not None else '∞'} bytes")
+
+    def disk_usage(self, path):
+        """du-style usage in bytes for a directory subtree or a file, in O(1)."""
+        if path in self.subtree_usage:
+            return self.subtree_usage[path] * self.SECTOR_SIZE
+        return len(self.file_allocation_table.get(path, ())) * self.SECTOR_SIZE
+
+    def app_disk_usage(self, app_name):
+        """Bytes owned by an application, in O(1)."""
+        return self.app_usage.get(app_name, 0) * self.SECTOR_SIZE
+
+    def capacity_report(self):
+        """Used and free space against the declared capacity, plus per-application usage."""
+        used_bytes = self.used_sectors * self.SECTOR_SIZE
+        capacity_bytes = self.capacity_sectors * self.SECTOR_SIZE
+        print("\n--- CAPACITY REPORT ---")
+        print(f"| {'Declared capacity':<26} | {self.capacity} GB ({self.capacity_sectors:,} sectors)")
+        print(f"| {'Used':<26} | {used_bytes:,} bytes ({100 * used_bytes / capacity_bytes:.6f}%)")
+        print(f"| {'Free':<26} | {capacity_bytes - used_bytes:,} bytes")
+        for app_name, sectors in sorted(self.app_usage.items(), key=lambda item: -item[1]):
+            limit = self.app_quotas.get(app_name)
+            print(f"| {'App: ' + app_name:<26} | {sectors * self.SECTOR_SIZE:,} bytes"
+                  + (f" of {limit * self.SECTOR_SIZE:,} quota" if limit is not None else ""))
+        return {"used_bytes": used_bytes, "capacity_bytes": capacity_bytes}
+
+    def create_directory(self, directory_name, owner=None):
         """
         Simulates creating a directory by reserving a sector and creating a FAT entry.
         """
@@ -30,26 +146,72 @@ class PlanetDiskHardDrive:
             print(f"❌ Directory '{directory_name}' already exists.")
             return
 
-        # 1. Reserve a free sector for the directory metadata
-        dir_sector = self.next_free_sector
-        
+        # 1. Reserve a free sector for the directory metadata (charged against quotas first)
+        owner = owner or self.application_of(directory_name)
+        try:
+            self._charge(directory_name, 1, owner, is_directory=True)
+        except QuotaExceededError as error:
+            print(f"❌ Cannot create '{directory_name}': {error}")
+            return
+        dir_sector = self._allocate_sectors(1)[0]
+        self._owner[directory_name] = owner
+
         # 2. Hard-coded initial directory content (pointers to self and parent)
         dir_content = f"TYPE:DIRECTORY|ENTRIES:2|.:{dir_sector}|..:PARENT"
-        
+
         # 3. Write the directory content to the disk
         self.write_data(
-            sector=dir_sector, 
-            text_data=dir_content, 
+            sector=dir_sector,
+            text_data=dir_content,
             status="[DIR CREATE]"
         )
-        
+
         # 4. Update the File Allocation Table (FAT)
         # The FAT entry is the "mount point" for the directory
         self.file_allocation_table[directory_name] = [dir_sector]
-        
+
         print(f"✅ Directory '{directory_name}' successfully created in Sector {dir_sector}.")
         print(f"   FAT Entry: {directory_name} -> {self.file_allocation_table[directory_name]}")
 
+    def write_file(self, file_name, content, owner=None, quiet=False):
+        """Writes (or replaces) a file; quotas see only the change in its size."""
+        owner = owner or self._owner.get(file_name) or self.application_of(file_name)
+        old_chain = self.file_allocation_table.get(file_name, [])
+        needed = max(1, -(-len(content) // self.SECTOR_SIZE))
+        try:
+            self._charge(file_name, needed - len(old_chain), owner)
+        except QuotaExceededError as error:
+            print(f"❌ Cannot write '{file_name}': {error}")
+            return None
+
+        chain = old_chain[:needed] + self._allocate_sectors(needed - len(old_chain))
+        self.free_sectors.extend(old_chain[needed:])
+        for sector in old_chain[needed:]:
+            self.data_blocks.pop(sector, None)
+        for i, sector in enumerate(chain):
+            self.write_data(sector, content[i * self.SECTOR_SIZE:(i + 1) * self.SECTOR_SIZE], status="[FILE WRITE]", quiet=quiet)
+        self.file_allocation_table[file_name] = chain
+        self._owner[file_name] = owner
+        return chain
+
+    def delete_path(self, path):
+        """Deletes a file or an empty directory and returns its sectors to the free list."""
+        chain = self.file_allocation_table.get(path)
+        if chain is None:
+            print(f"❌ '{path}' not found.")
+            return 0
+        if path in self.subtree_usage and self.subtree_usage[path] > len(chain):
+            print(f"❌ Directory '{path}' is not empty.")
+            return 0
+        self._charge(path, -len(chain), self._owner.pop(path))
+        del self.file_allocation_table[path]
+        self.subtree_usage.pop(path, None)
+        self.quotas.pop(path, None)
+        for sector in chain:
+            self.data_blocks.pop(sector, None)
+        self.free_sectors.extend(chain)
+        return len(chain)
+
 
 # --- Execution ---
 
@@ -65,11 +227,36 @@ my_disk.create_directory("teddy_server/logs")
 # 3. Add a placeholder for a file inside one of the directories
 file_name = "teddy_server/src/main.py"
 file_content = "def main(): # File content is stored contiguously here"
-file_sector = my_disk.next_free_sector
-
-my_disk.write_data(file_sector, file_content, status="[FILE WRITE]")
-my_disk.file_allocation_table[file_name] = [file_sector]
+my_disk.write_file(file_name, file_content)
 
 print("\n--- Final File Allocation Table (Mount Points) ---")
 for name, sectors in my_disk.file_allocation_table.items():
     print(f"| {name:<20} | Sectors: {sectors}")
+
+# 4. Quotas: the log directory may hold at most 8 KB
+my_disk.set_quota("teddy_server/logs", 8 * 1024)
+for day in range(1, 5):
+    my_disk.write_file(f"teddy_server/logs/day_{day}.log", f"LOG_LINE day {day}. teddy_server heartbeat OK. " * 60)
+
+# 5. An application tree under C:/ProgramFiles, with a per-application quota
+for directory in ("C:", "C:/ProgramFiles", "C:/ProgramFiles/Teddy_Server", "C:/ProgramFiles/Teddy_Server/plugins"):
+    my_disk.create_directory(directory)
+my_disk.set_app_quota("Teddy_Server", 4 * 1024 * 1024)
+start = time.perf_counter()
+for i in range(5000):
+    my_disk.write_file(f"C:/ProgramFiles/Teddy_Server/plugins/plugin_{i:04d}.py", f"# Teddy plugin {i}\n" * 20, quiet=True)
+print(f"\n📦 5,000 plugin files written in {time.perf_counter() - start:.3f}s")
+my_disk.write_file("C:/ProgramFiles/Teddy_Server/plugins/oversized.bin", "X" * 2 * 1024 * 1024)
+
+# 6. du-style queries: one lookup vs. summing the FAT
+start = time.perf_counter()
+indexed = my_disk.disk_usage("C:/ProgramFiles/Teddy_Server")
+indexed_us = (time.perf_counter() - start) * 1_000_000
+start = time.perf_counter()
+scanned = sum(len(chain) for path, chain in my_disk.file_allocation_table.items()
+              if path == "C:/ProgramFiles/Teddy_Server" or path.startswith("C:/ProgramFiles/Teddy_Server/")) * my_disk.SECTOR_SIZE
+scanned_us = (time.perf_counter() - start) * 1_000_000
+print(f"📊 du C:/ProgramFiles/Teddy_Server: {indexed:,} bytes in {indexed_us:.1f} µs "
+      f"(FAT scan: {scanned:,} bytes in {scanned_us:.0f} µs)")
+print(f"📊 du teddy_server: {my_disk.disk_usage('teddy_server'):,} bytes")
+my_disk.capacity_report()
@@ -0,0 +1,348 @@
+"""
+Binary metadata image for the Planet Disk FAT, directory and commit records.
+
+Loading is zero-copy and does not grow with the FAT. Saving does: pack_metadata() rebuilds
+every table from the in-memory dicts on each call (nothing is patched in place), which costs
+roughly 0.7-1 s per million FAT entries on CPython, mostly in visiting the entries in name
+order and flattening their sector chains. Save metadata at checkpoints, not after every FAT change.
+"""
+import itertools # Offset tables from running totals
+import struct # Fixed-layout binary records
+import sys # Byte order check for zero-copy array views
+import time # For timing save/load and commit timestamps
+import zlib # CRC32 per metadata block
+from array import array # Compact uint32 sector/offset tables
+
+# --- On-Disk Metadata Format (version 1) ---
+#
+#   HEADER  <4sHHIII   magic 'PDFT', version, flags, block count, FAT entry count, header CRC32
+#   BLOCK   <4sII      tag, payload length, payload CRC32, followed by the payload
+#
+#   NOFF  uint32[n+1]  offsets of each FAT name inside NAME (names are sorted, so lookups can bisect)
+#   NAME  bytes        UTF-8 FAT names, back to back
+#   COFF  uint32[n+1]  offsets of each sector chain inside CHNS
+#   CHNS  uint32[]     sector chains, back to back
+#   DIRS  records      <IIHH dir sector, parent sector (0 = root), entries, name length + name
+#   CMTS  records      <8sIIHHH hash, code sector, timestamp, file/author/message lengths + strings
+#   HIGH  uint32[1]    first sector past every chain (optional; readers fall back to scanning CHNS)
+#
+# All integers are little-endian.
+
+FAT_MAGIC = b"PDFT"
+FAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+BLOCK = struct.Struct("<4sII")
+DIR_RECORD = struct.Struct("<IIHH")
+COMMIT_RECORD = struct.Struct("<8sIIHHH")
+REQUIRED_BLOCKS = (b"NOFF", b"NAME", b"COFF", b"CHNS")
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+class FatFormatError(ValueError):
+    """Raised when a metadata image is truncated, corrupted or from an unknown version."""
+
+
+def _ushort(value, field):
+    """Checks that a count or length fits the image's 16-bit record fields."""
+    if not 0 <= value <= 0xFFFF:
+        raise ValueError(f"{field} is {value:,}; the metadata format stores it in 16 bits (max 65,535).")
+    return value
+
+
+def _uint32_block(values):
+    """Packs an iterable of sector numbers/offsets as little-endian uint32."""
+    table = array("I", values)
+    if not _NATIVE_LITTLE:
+        table.byteswap()
+    return table.tobytes()
+
+
+def _uint32_view(payload):
+    """Zero-copy uint32 view over a block payload (copied only on big-endian hosts)."""
+    if _NATIVE_LITTLE:
+        return payload.cast("I")
+    table = array("I", payload.tobytes())
+    table.byteswap()
+    return memoryview(table)
+
+
+def pack_metadata(file_allocation_table, directories=(), commits=()):
+    """
+    Serializes a FAT plus directory and commit records into one versioned binary image.
+    The whole image is rebuilt on every call, so the cost is linear in the FAT size.
+    directories: iterable of (name, dir_sector, parent_sector, entries)
+    commits:     iterable of (hash, filename, author, message, code_sector, timestamp)
+    """
+    names = sorted(file_allocation_table)
+    name_blob = "".join(names).encode("utf-8")
+    if len(name_blob) == sum(map(len, names)): # All-ASCII names: byte offsets equal character offsets
+        name_lengths = map(len, names)
+    else:
+        name_lengths = [len(name.encode("utf-8")) for name in names]
+    name_offsets = itertools.accumulate(name_lengths, initial=0)
+
+    chains = list(map(file_allocation_table.__getitem__, names))
+    chain_offsets = itertools.accumulate(map(len, chains), initial=0)
+    sectors = array("I", itertools.chain.from_iterable(chains))
+    high_water = max(sectors) + 1 if sectors else 1
+    if not _NATIVE_LITTLE:
+        sectors.byteswap()
+
+    dir_records = []
+    for name, dir_sector, parent_sector, entries in directories:
+        raw = name.encode("utf-8")
+        dir_records.append(DIR_RECORD.pack(dir_sector, parent_sector, _ushort(entries, f"Directory '{name}' entry count"),
+                                           _ushort(len(raw), f"Directory name length of '{name}'")) + raw)
+
+    commit_records = []
+    for commit_hash, filename, author, message, code_sector, timestamp in commits:
+        raw_hash = commit_hash.encode("ascii")
+        if len(raw_hash) > 8:
+            raise ValueError(f"Commit hash '{commit_hash}' is longer than the 8 bytes the metadata format stores.")
+        strings = [filename.encode("utf-8"), author.encode("utf-8"), message.encode("utf-8")]
+        lengths = [_ushort(len(raw), f"Commit {commit_hash} {field} length")
+                   for raw, field in zip(strings, ("filename", "author", "message"))]
+        commit_records.append(
+            COMMIT_RECORD.pack(raw_hash, code_sector, int(timestamp), *lengths) + b"".join(strings)
+        )
+
+    blocks = [
+        (b"NOFF", _uint32_block(name_offsets)),
+        (b"NAME", name_blob),
+        (b"COFF", _uint32_block(chain_offsets)),
+        (b"CHNS", sectors.tobytes()),
+        (b"DIRS", b"".join(dir_records)),
+        (b"CMTS", b"".join(commit_records)),
+        (b"HIGH", _uint32_block([high_water])),
+    ]
+
+    header = HEADER.pack(FAT_MAGIC, FAT_VERSION, 0, len(blocks), len(names), 0)
+    header = header[:-4] + struct.pack("<I", zlib.crc32(header[:-4]))
+    parts = [header]
+    for tag, payload in blocks:
+        parts.append(BLOCK.pack(tag, len(payload), zlib.crc32(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+class FatImage:
+    """
+    Zero-copy reader over a packed metadata image. Nothing is rebuilt on load:
+    lookups bisect the sorted name table and sector chains are sliced out of the buffer on demand.
+    """
+    def __init__(self, buffer, verify=True):
+        self._view = memoryview(buffer)
+        if len(self._view) < HEADER.size:
+            raise FatFormatError("Metadata image is truncated (no header).")
+
+        magic, version, flags, block_count, entry_count, header_crc = HEADER.unpack_from(self._view)
+        if magic != FAT_MAGIC:
+            raise FatFormatError(f"Bad magic {magic!r}; not a Planet Disk metadata image.")
+        if version != FAT_VERSION:
+            raise FatFormatError(f"Unsupported metadata version {version} (expected {FAT_VERSION}).")
+        if zlib.crc32(self._view[:HEADER.size - 4]) != header_crc:
+            raise FatFormatError("Header CRC mismatch.")
+
+        self.version = version
+        self.flags = flags
+        self.entry_count = entry_count
+        self._blocks = {}
+        offset = HEADER.size
+        for _ in range(block_count):
+            if offset + BLOCK.size > len(self._view):
+                raise FatFormatError("Metadata image is truncated (block header).")
+            tag, length, crc = BLOCK.unpack_from(self._view, offset)
+            offset += BLOCK.size
+            payload = self._view[offset:offset + length]
+            if len(payload) != length:
+                raise FatFormatError(f"Block {tag!r} is truncated.")
+            if verify and zlib.crc32(payload) != crc:
+                raise FatFormatError(f"Block {tag!r} CRC mismatch.")
+            self._blocks[tag] = payload
+            offset += length
+
+        for tag in REQUIRED_BLOCKS:
+            if tag not in self._blocks:
+                raise FatFormatError(f"Required block {tag!r} is missing.")
+        self._name_offsets = _uint32_view(self._blocks[b"NOFF"])
+        self._names = self._blocks[b"NAME"]
+        self._chain_offsets = _uint32_view(self._blocks[b"COFF"])
+        self._sectors = _uint32_view(self._blocks[b"CHNS"])
+
+    def __len__(self):
+        return self.entry_count
+
+    def _name_at(self, index):
+        return self._names[self._name_offsets[index]:self._name_offsets[index + 1]].tobytes()
+
+    def _index_of(self, name):
+        """Binary search over the sorted name table; returns -1 when absent."""
+        target = name.encode("utf-8")
+        low, high = 0, self.entry_count
+        while low < high:
+            mid = (low + high) // 2
+            if self._name_at(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.entry_count and self._name_at(low) == target:
+            return low
+        return -1
+
+    def __contains__(self, name):
+        return self._index_of(name) >= 0
+
+    def lookup(self, name):
+        """Returns the sector chain for a FAT entry (or None if the entry does not exist)."""
+        index = self._index_of(name)
+        if index < 0:
+            return None
+        return self._sectors[self._chain_offsets[index]:self._chain_offsets[index + 1]].tolist()
+
+    def high_water_sector(self):
+        """First sector past every chain in the image (where a fresh allocator may start)."""
+        if b"HIGH" in self._blocks:
+            return _uint32_view(self._blocks[b"HIGH"])[0]
+        return max(self._sectors) + 1 if len(self._sectors) else 1
+
+    def names(self):
+        """Iterates FAT names in sorted order without materializing the table."""
+        for index in range(self.entry_count):
+            yield self._name_at(index).decode("utf-8")
+
+    def entries(self):
+        """Iterates (name, sector chain) pairs sequentially (no per-entry search)."""
+        for index in range(self.entry_count):
+            chain = self._sectors[self._chain_offsets[index]:self._chain_offsets[index + 1]]
+            yield self._name_at(index).decode("utf-8"), chain.tolist()
+
+    def directories(self):
+        """Iterates (name, dir_sector, parent_sector, entries) directory records."""
+        payload = self._blocks.get(b"DIRS", memoryview(b""))
+        offset = 0
+        while offset < len(payload):
+            dir_sector, parent_sector, entries, name_length = DIR_RECORD.unpack_from(payload, offset)
+            offset += DIR_RECORD.size
+            name = payload[offset:offset + name_length].tobytes().decode("utf-8")
+            offset += name_length
+            yield name, dir_sector, parent_sector, entries
+
+    def commits(self):
+        """Iterates (hash, filename, author, message, code_sector, timestamp) commit records."""
+        payload = self._blocks.get(b"CMTS", memoryview(b""))
+        offset = 0
+        while offset < len(payload):
+            raw_hash, code_sector, timestamp, *lengths = COMMIT_RECORD.unpack_from(payload, offset)
+            offset += COMMIT_RECORD.size
+            strings = []
+            for length in lengths:
+                strings.append(payload[offset:offset + length].tobytes().decode("utf-8"))
+                offset += length
+            yield (raw_hash.rstrip(b"\0").decode("ascii"), *strings, code_sector, timestamp)
+
+    def to_dict(self):
+        """Materializes the full FAT as a Python dict (only needed for legacy code paths)."""
+        return {name: self.lookup(name) for name in self.names()}
+
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive whose FAT, directory and commit metadata are persisted
+    in a compact binary format instead of pipe-delimited text.
+    (Simplified methods from previous responses included for context.)
+    """
+    def __init__(self, capacity_gb):
+        self.capacity = capacity_gb
+        self.data_blocks = {}
+        self.file_allocation_table = {}
+        self.next_free_sector = 1
+        self.directories = {}  # name -> (dir_sector, parent_sector, entries)
+        self.commit_log = []   # (hash, filename, author, message, code_sector, timestamp)
+        print(f"======================================================")
+        print(f"🚀 Initializing Planet Disk with Binary Metadata.")
+        print(f"======================================================")
+
+    def write_data(self, sector, text_data, status="[WRITE]"):
+        """Writes data to a sector."""
+        self.data_blocks[sector] = text_data
+        self.next_free_sector = max(self.next_free_sector, sector + 1)
+
+    def read_sector(self, sector):
+        """Reads data from a sector."""
+        return self.data_blocks.get(sector, "RAW DATA ERROR")
+
+    def create_directory(self, directory_name):
+        """Creates a directory; its metadata is kept as a binary record rather than a text string."""
+        if directory_name in self.file_allocation_table:
+            print(f"❌ Directory '{directory_name}' already exists.")
+            return
+        parent_name = directory_name.rsplit("/", 1)[0] if "/" in directory_name else None
+        parent_sector = self.directories.get(parent_name, (0,))[0]
+        dir_sector = self.next_free_sector
+        self.write_data(dir_sector, f"TYPE:DIRECTORY|ENTRIES:2|.:{dir_sector}|..:{parent_sector or 'PARENT'}", status="[DIR CREATE]")
+        self.file_allocation_table[directory_name] = [dir_sector]
+        self.directories[directory_name] = (dir_sector, parent_sector, 2)
+        return True
+
+    def record_commit(self, commit_hash, filename, author, message, code_sector):
+        """Appends a commit record (the binary twin of 'COMMIT:{hash}|FILE:...|AUTHOR:...')."""
+        self.commit_log.append((commit_hash, filename, author, message, code_sector, int(time.time())))
+
+    # --- NEW BINARY METADATA METHODS ---
+    def save_metadata(self, path):
+        """Writes the FAT, directory and commit metadata as a single binary image."""
+        start = time.perf_counter()
+        image = pack_metadata(
+            self.file_allocation_table,
+            directories=((name, *record) for name, record in self.directories.items()),
+            commits=self.commit_log,
+        )
+        with open(path, "wb") as handle:
+            handle.write(image)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"💾 [META SAVE] {len(self.file_allocation_table):,} FAT entries -> {len(image):,} bytes in {elapsed_ms:.1f} ms")
+        return len(image)
+
+    def load_metadata(self, path, verify=True):
+        """
+        Maps a saved metadata image and returns a zero-copy FatImage.
+        The in-memory dicts are not rebuilt; call FatImage.to_dict() only if a legacy path needs them.
+        """
+        start = time.perf_counter()
+        with open(path, "rb") as handle:
+            image = FatImage(handle.read(), verify=verify)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"📂 [META LOAD] {len(image):,} FAT entries ready in {elapsed_ms:.1f} ms (CRC verified: {verify})")
+        return image
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    my_disk = PlanetDiskHardDrive(capacity_gb=4000)
+
+    # 1. Build a realistic tree plus a very large generated FAT
+    my_disk.create_directory("teddy_server")
+    my_disk.create_directory("teddy_server/src")
+    my_disk.create_directory("teddy_server/logs")
+    my_disk.record_commit("1a2b3c4d", "teddy_server.py", "rushikesh648", "Optimize database connection handling.", 7)
+
+    print("\n--- Generating 1,000,000 FAT entries ---")
+    sector = my_disk.next_free_sector
+    for i in range(1_000_000):
+        my_disk.file_allocation_table[f"teddy_server/logs/log_{i:07d}.txt"] = [sector, sector + 2]
+        sector += 3
+
+    # 2. Save and reload
+    path = os.path.join(tempfile.gettempdir(), "planet_disk_metadata.bin")
+    my_disk.save_metadata(path)
+    image = my_disk.load_metadata(path)
+
+    # 3. Zero-copy lookups
+    print(f"🔍 teddy_server/logs/log_0424242.txt -> {image.lookup('teddy_server/logs/log_0424242.txt')}")
+    print(f"🔍 Directories: {list(image.directories())}")
+    print(f"🔍 Commits: {list(image.commits())}")
+    os.remove(path)
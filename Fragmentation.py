@@ -1,3 +1,139 @@
+from bisect import insort # Keeps the distinct fragment counts ordered for top-K queries
+from itertools import islice # Takes only the names a top-K query needs from a bucket
+
+from Codec import get_codec # Whole-buffer binary view conversion
+
+
+class FragmentationIndex:
+    """
+    Continuously maintained fragmentation metrics. Every sector allocation and every
+    file free updates the numbers incrementally, so no query ever scans the FAT.
+    """
+    SEEK_BASE_MS = 4.0        # Cost of any head movement (settle + rotational latency)
+    SEEK_PER_SECTOR_MS = 0.01 # Extra cost per sector of distance travelled
+
+    def __init__(self):
+        self.files = {} # filename -> {"chain", "fragments", "gap_total", "seek_ms"}
+        self._by_fragments = {} # fragment count -> filenames, as an insertion-ordered dict
+        self._fragment_counts = [] # Sorted distinct keys of _by_fragments
+
+        # Free-space fragmentation inside the used region [1, high_watermark)
+        self._allocated = set()
+        self.high_watermark = 1
+        self.free_sectors = 0
+        self.free_extents = 0
+
+    # --- Bucket maintenance (top-K by fragment count) ---
+    def _bucket_remove(self, filename, fragments):
+        bucket = self._by_fragments[fragments]
+        bucket.pop(filename, None)
+        if not bucket:
+            del self._by_fragments[fragments]
+            self._fragment_counts.remove(fragments)
+
+    def _bucket_add(self, filename, fragments):
+        if fragments not in self._by_fragments:
+            self._by_fragments[fragments] = {}
+            insort(self._fragment_counts, fragments)
+        self._by_fragments[fragments][filename] = None
+
+    # --- Free-space maintenance ---
+    def _is_free(self, sector):
+        return 1 <= sector < self.high_watermark and sector not in self._allocated
+
+    def _mark_allocated(self, sector):
+        if sector in self._allocated:
+            return
+        if sector >= self.high_watermark:
+            if sector > self.high_watermark: # The skipped sectors become a free gap
+                if not self._is_free(self.high_watermark - 1):
+                    self.free_extents += 1
+                self.free_sectors += sector - self.high_watermark
+            self.high_watermark = sector + 1
+        else:
+            left, right = self._is_free(sector - 1), self._is_free(sector + 1)
+            self.free_sectors -= 1
+            if left and right:
+                self.free_extents += 1 # One free extent split in two
+            elif not left and not right:
+                self.free_extents -= 1 # A single-sector free extent disappears
+        self._allocated.add(sector)
+
+    def _mark_free(self, sector):
+        if sector not in self._allocated:
+            return
+        self._allocated.discard(sector)
+        left, right = self._is_free(sector - 1), self._is_free(sector + 1)
+        self.free_sectors += 1
+        if left and right:
+            self.free_extents -= 1 # Two free extents merge
+        elif not left and not right:
+            self.free_extents += 1
+
+    # --- Allocation hooks ---
+    def allocate(self, filename, sector):
+        """Records that 'sector' was appended to the end of a file's chain."""
+        entry = self.files.get(filename)
+        if entry is None:
+            entry = {"chain": [], "fragments": 0, "gap_total": 0, "seek_ms": 0.0}
+            self.files[filename] = entry
+        else:
+            self._bucket_remove(filename, entry["fragments"])
+
+        chain = entry["chain"]
+        if not chain:
+            entry["fragments"] = 1
+        elif sector != chain[-1] + 1:
+            distance = abs(sector - chain[-1] - 1)
+            entry["fragments"] += 1
+            entry["gap_total"] += distance
+            entry["seek_ms"] += self.SEEK_BASE_MS + self.SEEK_PER_SECTOR_MS * distance
+        chain.append(sector)
+        self._bucket_add(filename, entry["fragments"])
+        self._mark_allocated(sector)
+
+    def free_file(self, filename):
+        """Forgets a file and returns its sectors to the free-space metrics."""
+        entry = self.files.pop(filename, None)
+        if entry is None:
+            return
+        self._bucket_remove(filename, entry["fragments"])
+        for sector in entry["chain"]:
+            self._mark_free(sector)
+
+    # --- O(1) Queries ---
+    def file_metrics(self, filename):
+        """Fragment count, average gap (sectors) and estimated extra seek cost for one file."""
+        entry = self.files[filename]
+        breaks = entry["fragments"] - 1
+        return {
+            "fragments": entry["fragments"],
+            "average_gap": entry["gap_total"] / breaks if breaks else 0.0,
+            "seek_ms": entry["seek_ms"],
+        }
+
+    def top_fragmented(self, k):
+        """
+        The k most fragmented files, walking buckets from the highest fragment count down.
+        Ties keep the order in which files reached that count; only k names are ever visited.
+        """
+        result = []
+        for fragments in reversed(self._fragment_counts):
+            if fragments <= 1 or len(result) >= k:
+                break # Contiguous files are not fragmented
+            bucket = self._by_fragments[fragments]
+            result.extend((filename, fragments) for filename in islice(bucket, k - len(result)))
+        return result
+
+    def free_space_metrics(self):
+        """Disk-wide free-space fragmentation inside the used region."""
+        return {
+            "free_sectors": self.free_sectors,
+            "free_extents": self.free_extents,
+            "average_free_extent": self.free_sectors / self.free_extents if self.free_extents else 0.0,
+        }
+
+
 class PlanetDiskHardDrive:
     """
     A conceptual model of a hard drive (the 'Planet Disk')
@@ -9,12 +145,14 @@ class PlanetDiskHardDrive:
         self.data_blocks = {}
         # Stores the sectors that make up a file (to simulate a file system table)
         self.file_allocation_table = {} 
+        # Incrementally maintained fragmentation metrics (updated on every allocate/free)
+        self.fragmentation_index = FragmentationIndex()
         print(f"🚀 Initializing {self.capacity}GB Planet Disk Hard Drive with {self.interface} interface.")
         print("-" * 40)
 
     def text_to_binary(self, text):
         """Converts a string to its 8-bit ASCII binary representation."""
-        return ' '.join(format(ord(char), '08b') for char in text)
+        return get_codec().text_to_binary(text)
 
     def write_data(self, sector, text_data, is_fragment=False):
         """Simulates writing text data to a specific sector in binary."""
@@ -39,11 +177,16 @@ class PlanetDiskHardDrive:
         current_sector = start_sector
         
         print(f"\n--- Writing Fragmented File: **{filename}** ({len(fragments)} Fragments) ---")
+        # A rewrite replaces the old chain: release it first so the index never mixes chains
+        for sector in self.file_allocation_table.pop(filename, []):
+            self.data_blocks.pop(sector, None)
+        self.fragmentation_index.free_file(filename)
         for i, fragment in enumerate(fragments):
             # Write fragments to non-contiguous sectors to simulate fragmentation
             sector = current_sector + (i * 2) 
             self.write_data(sector, fragment, is_fragment=True)
             sector_chain.append(sector)
+            self.fragmentation_index.allocate(filename, sector)
         
         self.file_allocation_table[filename] = sector_chain
         print(f"🔗 File Allocation Table for {filename}: Sectors {sector_chain}")
@@ -67,8 +210,7 @@ class PlanetDiskHardDrive:
         for i, sector in enumerate(sector_chain):
             binary_fragment = self.read_sector(sector)
             
-            # Simplified binary to text conversion for output
-            text_fragment = ''.join(chr(int(binary_fragment[i:i+8], 2)) for i in range(0, len(binary_fragment), 9) if binary_fragment[i:i+8])
+            text_fragment = get_codec().binary_to_text(binary_fragment)
             
             full_binary.append(binary_fragment)
             full_text.append(text_fragment)
@@ -79,6 +221,30 @@ class PlanetDiskHardDrive:
         print(f"Text:   {''.join(full_text)}")
 
 
+    # --- NEW FRAGMENTATION ANALYTICS METHODS ---
+    def delete_file(self, filename):
+        """Deletes a file, freeing its sectors and updating the fragmentation index."""
+        if filename not in self.file_allocation_table:
+            print(f"\n❌ Error: File '{filename}' not found on disk.")
+            return
+        for sector in self.file_allocation_table.pop(filename):
+            self.data_blocks.pop(sector, None)
+        self.fragmentation_index.free_file(filename)
+        print(f"\n🗑️ Deleted {filename}.")
+
+    def fragmentation_report(self, top_k=3):
+        """Prints the most fragmented files and free-space fragmentation without scanning the FAT."""
+        index = self.fragmentation_index
+        print(f"\n--- FRAGMENTATION REPORT (Top {top_k}) ---")
+        for filename, fragments in index.top_fragmented(top_k):
+            metrics = index.file_metrics(filename)
+            print(f"| {filename:<24} | Fragments: {fragments:<3} | Avg gap: {metrics['average_gap']:5.1f} sectors "
+                  f"| Est. seek cost: {metrics['seek_ms']:6.2f} ms")
+        free = index.free_space_metrics()
+        print(f"| Free space: {free['free_sectors']} sectors in {free['free_extents']} extents "
+              f"(avg {free['average_free_extent']:.1f} sectors/extent)")
+
+
 # --- Hard-Coded Execution Block ---
 
 # 1. Hard-Coded Disk Creation
@@ -96,3 +262,14 @@ my_disk.write_fragmented_file(
 
 # 3. Hard-Coded Fragmented Read Operation
 my_disk.read_fragmented_file(filename="teddy_server_log.txt")
+
+# 4. Hard-Coded Fragmentation Analytics
+my_disk.write_fragmented_file(
+    filename="teddy_server_error.txt", 
+    content="ERR_START. Timeout talking to database. Retrying. Giving up.", 
+    start_sector=11, 
+    fragment_size=10
+)
+my_disk.fragmentation_report(top_k=2)
+my_disk.delete_file("teddy_server_log.txt")
+my_disk.fragmentation_report(top_k=2)
@@ -0,0 +1,325 @@
+import hashlib # Commit hashes, as in Rollback.py
+import itertools # Resuming a root scan after its dict grows
+import time # Commit timestamps and the GC time budget
+
+_CYCLE_DONE = object()
+
+
+class _RootTable(dict):
+    """
+    Dict that also records its keys in an append-only list. A dict iterator dies as soon as
+    the dict is resized, so the collector walks this list by index instead; entries added
+    while it walks need no visit (they are shaded by the barrier).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.order = list(self)
+        self._removed = 0
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self.order.append(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._removed += 1
+        if self._removed > len(self): # Compact; a scan in progress keeps walking the old list
+            self.order = list(self)
+            self._removed = 0
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self.order = []
+        self._removed = 0
+
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive with commits, rollbacks, snapshots and backups, plus an incremental
+    mark-and-sweep garbage collector that reclaims sectors none of them can reach.
+    (Simplified methods from previous responses included for context.)
+    """
+    def __init__(self, capacity_gb):
+        self.capacity = capacity_gb
+        self.data_blocks = {}
+        self.file_allocation_table = _RootTable()
+        self.next_free_sector = 1
+        self.free_sectors = []
+        self.commit_log_sectors = list(range(100, 105))
+        self.commit_count = 0
+        self.commit_history = [] # (hash, filename, code_sector, timestamp), oldest first
+        self.old_versions = _RootTable()      # filename -> {hash: (sector, timestamp)}; old code stays on disk
+        self.snapshots = _RootTable()         # name -> frozen copy of the FAT
+        self.backup_sector_map = _RootTable()
+
+        # --- Retention Policy ---
+        self.keep_versions = 5      # Old versions kept per file
+        self.max_version_age = None # Seconds; None keeps versions regardless of age
+        self.keep_commits = 10      # Commits kept in history
+
+        # --- Incremental GC State ---
+        self._gc_phase = "idle" # idle -> retention -> mark -> sweep -> idle
+        self._gc_marked = bytearray() # One mark byte per sector below the cycle's high-water mark
+        self._gc_work = None    # Generator holding the cycle's cursors between steps
+        self._gc_reclaimed_this_cycle = 0
+        self.gc_stats = {"cycles": 0, "steps": 0, "reclaimed": 0}
+        print(f"======================================================")
+        print(f"🚀 Initializing Planet Disk with Garbage Collection.")
+        print(f"======================================================")
+
+    def write_data(self, sector, text_data, status="[WRITE]"):
+        """Writes data to a sector (a sector written during a GC cycle is never swept in it)."""
+        self.data_blocks[sector] = text_data
+        self._gc_shade(sector) # Write barrier
+        if sector not in self.commit_log_sectors:
+            self.next_free_sector = max(self.next_free_sector, sector + 1)
+
+    def read_sector(self, sector):
+        return self.data_blocks.get(sector, "RAW DATA ERROR")
+
+    def _gc_shade(self, sector):
+        """Barrier: a sector written or relinked while a cycle runs survives that cycle."""
+        if self._gc_phase != "idle" and sector < len(self._gc_marked):
+            self._gc_marked[sector] = 1
+
+    def _allocate_sector(self):
+        """Reuses a reclaimed sector when one is available."""
+        while self.free_sectors:
+            sector = self.free_sectors.pop()
+            if sector not in self.data_blocks:
+                return sector
+        sector = self.next_free_sector
+        while sector in self.commit_log_sectors:
+            sector += 1
+        return sector
+
+    # --- Version Control (from Rollback.py) ---
+    def simulate_commit(self, filename, code_change, author, message):
+        """Writes new code to a fresh sector; the previous version's sector is kept as history."""
+        current = self.file_allocation_table.get(filename)
+        if current:
+            prev_content = self.read_sector(current[0])
+            prev_hash = hashlib.sha1(prev_content.encode("utf-8")).hexdigest()[:8]
+            self._gc_shade(current[0]) # Moves from the FAT into history, possibly behind the mark cursor
+            self.old_versions.setdefault(filename, {})[prev_hash] = (current[0], time.time())
+
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        new_hash = hashlib.sha1(f"{timestamp}{author}{message}{code_change}{self.commit_count}".encode("utf-8")).hexdigest()[:8]
+        new_code_sector = self._allocate_sector()
+        self.write_data(new_code_sector, code_change, status="[CODE WRITE]")
+        self.file_allocation_table[filename] = [new_code_sector]
+
+        commit_log_sector = self.commit_log_sectors[self.commit_count % len(self.commit_log_sectors)]
+        self.write_data(commit_log_sector, f"COMMIT:{new_hash}|FILE:{filename}|AUTHOR:{author}", status="[LOG WRITE]")
+        self.commit_history.append((new_hash, filename, new_code_sector, time.time()))
+        self.commit_count += 1
+        return new_hash
+
+    def rollback_commit(self, filename, target_hash):
+        """Points the file back at a retained old version's sector."""
+        versions = self.old_versions.get(filename, {})
+        if target_hash not in versions:
+            print(f"\n❌ ROLLBACK FAILED: Target hash {target_hash} not found for {filename}.")
+            return
+        sector, _ = versions[target_hash]
+        for old_sector in self.file_allocation_table.get(filename, ()):
+            self._gc_shade(old_sector)
+        self._gc_shade(sector)
+        self.file_allocation_table[filename] = [sector]
+        print(f"✅ ROLLBACK COMPLETE. {filename} now served from Sector {sector}.")
+
+    def take_snapshot(self, name):
+        self.snapshots[name] = {filename: list(chain) for filename, chain in self.file_allocation_table.items()}
+
+    # --- NEW RETENTION + GC METHODS ---
+    def set_retention(self, keep_versions=None, max_version_age=None, keep_commits=None, clear_max_version_age=False):
+        """
+        Configures how much version history survives garbage collection. Arguments left as
+        None keep their current value; clear_max_version_age=True removes the age limit.
+        """
+        if keep_versions is not None:
+            self.keep_versions = keep_versions
+        if keep_commits is not None:
+            self.keep_commits = keep_commits
+        if clear_max_version_age:
+            self.max_version_age = None
+        elif max_version_age is not None:
+            self.max_version_age = max_version_age
+        print(f"📜 Retention: {self.keep_versions} versions/file, {self.keep_commits} commits, "
+              f"max age {self.max_version_age or '∞'} s")
+
+    def apply_retention(self):
+        """Drops history beyond the retention policy; its sectors become garbage for the next GC cycle."""
+        dropped = 0
+        for dropped in self._retention_work():
+            pass
+        return dropped
+
+    def _retention_work(self):
+        """Retention one file at a time; yields the running count of dropped versions/commits."""
+        now = time.time()
+        dropped = 0
+        for _, versions in self._scan(self.old_versions):
+            ordered = sorted(versions.items(), key=lambda item: item[1][1], reverse=True)
+            for rank, (version_hash, (sector, saved_at)) in enumerate(ordered):
+                too_old = self.max_version_age is not None and now - saved_at > self.max_version_age
+                if rank >= self.keep_versions or too_old:
+                    del versions[version_hash]
+                    dropped += 1
+            yield dropped
+        excess = len(self.commit_history) - self.keep_commits
+        if excess > 0:
+            del self.commit_history[:excess]
+            dropped += excess
+        yield dropped
+
+    @staticmethod
+    def _scan(table):
+        """
+        Yields (key, value) pairs of a root dict across GC steps. _RootTable entries are walked by
+        index over the keys present when the scan starts. A plain dict (a small version history
+        or frozen snapshot) is iterated directly, and copied only if it grows between two steps.
+        """
+        if isinstance(table, _RootTable):
+            order = table.order
+            for index in range(len(order)):
+                key = order[index]
+                if key in table:
+                    yield key, table[key]
+            return
+        visited = 0
+        try:
+            for item in table.items():
+                yield item
+                visited += 1
+            return
+        except RuntimeError: # Resized between two steps
+            pass
+        for key in list(itertools.islice(table, visited, None)):
+            if key in table:
+                yield key, table[key]
+
+    def _gc_roots(self):
+        """Every sector reachable from the FAT, snapshots, backups, commit log and retained history."""
+        for _, chain in self._scan(self.file_allocation_table):
+            yield from chain
+        for _, snapshot in self._scan(self.snapshots):
+            for _, chain in self._scan(snapshot):
+                yield from chain
+        for _, sector in self._scan(self.backup_sector_map):
+            yield sector
+        yield from self.commit_log_sectors
+        for index in range(len(self.commit_history)): # Only appended to while marking
+            yield self.commit_history[index][2]
+        for _, versions in self._scan(self.old_versions):
+            for _, (sector, _) in self._scan(versions):
+                yield sector
+
+    def _gc_cycle(self):
+        """
+        One collection cycle as a generator, so every cursor (retention, roots, sectors) resumes
+        where the previous step stopped. Yields after each unit of work.
+        """
+        # Snapshot-at-the-beginning: everything reachable now survives this cycle; sectors written
+        # or relinked later are shaded by _gc_shade(), so the mutator may run between steps
+        # A bitmap rather than a set: a set holding millions of sectors rehashes in one go
+        self._gc_phase = "retention"
+        self._gc_marked = bytearray(self.next_free_sector)
+        self._gc_reclaimed_this_cycle = 0
+        yield from self._retention_work()
+
+        self._gc_phase = "mark"
+        marked = self._gc_marked
+        for sector in self._gc_roots():
+            if sector < len(marked):
+                marked[sector] = 1
+            yield
+
+        # Every sector at or past the cycle's high-water mark was written during the cycle, so the
+        # sweep walks sector numbers below it instead of a copy of data_blocks
+        self._gc_phase = "sweep"
+        for sector in range(1, len(marked)):
+            if not marked[sector] and sector in self.data_blocks:
+                del self.data_blocks[sector]
+                self.free_sectors.append(sector)
+                self.gc_stats["reclaimed"] += 1
+                self._gc_reclaimed_this_cycle += 1
+            yield
+
+    def gc_step(self, budget_ms=1.0):
+        """
+        Runs the collector for at most 'budget_ms' and returns True when a full cycle finished.
+        The cycle trims history, marks from the roots, then frees every unmarked sector.
+        Between steps, existing root entries should be relinked through the disk's methods
+        (which shade the sectors involved) rather than overwritten directly.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        self.gc_stats["steps"] += 1
+        if self._gc_work is None:
+            self._gc_work = self._gc_cycle()
+
+        while time.perf_counter() < deadline:
+            for _ in range(256):
+                if next(self._gc_work, _CYCLE_DONE) is _CYCLE_DONE:
+                    self._gc_phase = "idle"
+                    self._gc_work = None
+                    self.gc_stats["cycles"] += 1
+                    return True
+        return False
+
+    def collect(self, budget_ms=1.0):
+        """Runs time-boxed GC steps until a full cycle completes (callers may interleave I/O)."""
+        steps = 0
+        while True:
+            steps += 1
+            if self.gc_step(budget_ms):
+                break
+        print(f"♻️ [GC] Cycle complete in {steps} step(s) of ≤{budget_ms} ms: "
+              f"{self._gc_reclaimed_this_cycle} sector(s) reclaimed, {len(self.data_blocks)} in use.")
+        return self._gc_reclaimed_this_cycle
+
+
+# --- Hard-Coded Execution Block ---
+if __name__ == "__main__":
+    my_disk = PlanetDiskHardDrive(capacity_gb=4000)
+    my_disk.set_retention(keep_versions=3, keep_commits=5)
+
+    # 1. Many commits: each allocates a new code sector and never frees the old one
+    for i in range(2000):
+        my_disk.simulate_commit(
+            filename="teddy_server.py",
+            code_change=f"def handle_request(data): return process_v{i}(data)",
+            author="rushikesh648",
+            message=f"Optimization pass {i}",
+        )
+    my_disk.take_snapshot("before-hotfix")
+    my_disk.backup_sector_map["C:/ProgramFiles/Teddy_Server/server.exe"] = my_disk.file_allocation_table["teddy_server.py"][0]
+    print(f"📦 Sectors in use after 2000 commits: {len(my_disk.data_blocks)}")
+
+    # 2. Incremental collection under a 0.5 ms budget per step
+    my_disk.collect(budget_ms=0.5)
+
+    # 3. Retained history still rolls back; reclaimed sectors are reused by new commits
+    version_hash = next(iter(my_disk.old_versions["teddy_server.py"]))
+    my_disk.rollback_commit("teddy_server.py", version_hash)
+    my_disk.simulate_commit("teddy_server.py", "def handle_request(data): return hotfix(data)", "rushikesh648", "Hotfix")
+    print(f"🔁 Hotfix written to reclaimed Sector {my_disk.file_allocation_table['teddy_server.py'][0]}")
@@ -1,6 +1,8 @@
 import hashlib # Used to generate the commit hash (metadata)
 import time # Used for the commit timestamp
 
+from Codec import get_codec # Whole-buffer binary view conversion
+
 class PlanetDiskHardDrive:
     # ... (Include the __init__, text_to_binary, binary_to_text, write_data, 
     # read_sector, write_fragmented_file, and defragment_file methods from the previous response) ...
@@ -19,10 +21,10 @@ class PlanetDiskHardDrive:
         print("-" * 65)
 
     def text_to_binary(self, text):
-        return ' '.join(format(ord(char), '08b') for char in text)
+        return get_codec().text_to_binary(text)
 
     def binary_to_text(self, binary_fragment):
-        return ''.join(chr(int(binary_fragment[i:i+8], 2)) for i in range(0, len(binary_fragment), 9) if binary_fragment[i:i+8])
+        return get_codec().binary_to_text(binary_fragment)
 
     def write_data(self, sector, text_data, status="[CONTIGUOUS]"):
         binary_data = self.text_to_binary(text_data)
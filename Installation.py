@@ -75,9 +75,123 @@ class PlanetDiskHardDrive:
         print(f"   Executable Location: Sector {exe_sector}")
 
 
+    # --- NEW MANIFEST-DRIVEN INSTALLER ---
+    SECTOR_SIZE = 512 # Characters of file payload per sector
+
+    def install_package(self, manifest, fail_after=None):
+        """
+        Installs a whole application tree described by a manifest in one transaction:
+        one contiguous extent is preallocated, every payload is staged and written in a
+        single batched pass, and the FAT changes are committed together at the end.
+        If anything fails, no sector or FAT entry from the package is left behind.
+
+        manifest = {
+            "name": "Teddy_Server", "version": "1.0.0",
+            "root": "C:/ProgramFiles/Teddy_Server",          # optional, this is the default
+            "directories": ["config", "logs"],                # relative to root
+            "files": {"server.exe": "...", "config/settings.ini": "..."},
+        }
+        fail_after: simulate a crash after this many sectors have been written (for testing).
+        """
+        name, version = manifest["name"], manifest["version"]
+        root_dir = manifest.get("root", f"C:/ProgramFiles/{name}").rstrip("/")
+        files = manifest.get("files", {})
+        print(f"\n======================================================")
+        print(f"📦 Starting Transactional Install of **{name}** (v{version}): {len(files)} files")
+        print(f"======================================================")
+
+        # 1. PLAN THE TREE (every parent directory of every file is created)
+        declared_dirs = set(manifest.get("directories", []))
+        directories = {root_dir}
+        for relative in list(declared_dirs) + list(files):
+            parts = relative.strip("/").split("/")
+            limit = len(parts) if relative in declared_dirs else len(parts) - 1
+            for depth in range(1, limit + 1):
+                directories.add(f"{root_dir}/{'/'.join(parts[:depth])}")
+        directories = sorted(directories, key=lambda path: (path.count("/"), path))
+        file_paths = {f"{root_dir}/{relative.strip('/')}": content for relative, content in files.items()}
+
+        conflicts = [path for path in list(directories) + list(file_paths) if path in self.file_allocation_table]
+        if conflicts:
+            print(f"❌ INSTALL ABORTED: {len(conflicts)} path(s) already exist, e.g. '{conflicts[0]}'.")
+            return False
+
+        # 2. PREALLOCATE ONE CONTIGUOUS EXTENT
+        file_sectors = {path: max(1, -(-len(content) // self.SECTOR_SIZE)) for path, content in file_paths.items()}
+        extent_start = self.next_free_sector
+        extent_length = len(directories) + sum(file_sectors.values())
+
+        # 3. STAGE ALL SECTORS AND FAT ENTRIES IN MEMORY
+        staged_blocks = {}
+        staged_fat = {}
+        sector = extent_start
+        for directory in directories:
+            staged_fat[directory] = [sector]
+            sector += 1
+        for path, content in file_paths.items():
+            chain = list(range(sector, sector + file_sectors[path]))
+            for i, chain_sector in enumerate(chain):
+                staged_blocks[chain_sector] = content[i * self.SECTOR_SIZE:(i + 1) * self.SECTOR_SIZE]
+            staged_fat[path] = chain
+            sector += len(chain)
+
+        children = {directory: 0 for directory in directories}
+        for path in list(directories[1:]) + list(file_paths):
+            children[path.rsplit("/", 1)[0]] += 1
+        for directory in directories:
+            dir_sector = staged_fat[directory][0]
+            parent = directory.rsplit("/", 1)[0]
+            parent_pointer = staged_fat[parent][0] if parent in staged_fat else "PARENT"
+            staged_blocks[dir_sector] = f"TYPE:DIRECTORY|ENTRIES:{children[directory] + 2}|.:{dir_sector}|..:{parent_pointer}"
+
+        # 4. WRITE EVERY PAYLOAD IN ONE BATCHED PASS
+        written = []
+        try:
+            for count, (block_sector, payload) in enumerate(sorted(staged_blocks.items()), start=1):
+                self.data_blocks[block_sector] = payload
+                written.append(block_sector)
+                if fail_after is not None and count >= fail_after:
+                    raise IOError(f"Simulated write failure at sector {block_sector}")
+        except IOError as error:
+            # ROLLBACK: nothing was committed to the FAT, so only the staged sectors are undone
+            for block_sector in written:
+                del self.data_blocks[block_sector]
+            print(f"❌ INSTALL FAILED ({error}). Rolled back {len(written)} sector(s); FAT untouched.")
+            return False
+        print(f"💾 [BATCH WRITE] {len(staged_blocks)} sectors written to extent {extent_start}..{extent_start + extent_length - 1}")
+
+        # 5. COMMIT THE FAT CHANGES ATOMICALLY
+        self.file_allocation_table.update(staged_fat)
+        self.next_free_sector = extent_start + extent_length
+
+        print(f"\n✅ **TRANSACTIONAL INSTALLATION COMPLETE**")
+        print(f"   Application Root: {root_dir} (Sector {self.file_allocation_table[root_dir][0]})")
+        print(f"   {len(directories)} directories and {len(file_paths)} files in one contiguous extent.")
+        return True
+
+
 # --- Execution ---
 
 my_disk = PlanetDiskHardDrive(capacity_gb=1000)
 
 # Simulate the installation of the Teddy Server application
 my_disk.install_application(app_name="Teddy_Server", version="1.0.0")
+
+# Simulate a manifest-driven install of a large plugin tree in one transaction
+plugin_manifest = {
+    "name": "Teddy_Plugins",
+    "version": "2.0.0",
+    "directories": ["logs"],
+    "files": {
+        f"plugins/plugin_{i:04d}/module.py": f"# Teddy plugin {i}\ndef handle(data): return data" for i in range(2000)
+    },
+}
+plugin_manifest["files"]["config/settings.ini"] = "// CONFIG: port=8081; plugins=2000"
+
+# A crash halfway through leaves no partial state behind...
+sectors_before = len(my_disk.data_blocks)
+my_disk.install_package(plugin_manifest, fail_after=1500)
+print(f"   Sectors before/after failed install: {sectors_before}/{len(my_disk.data_blocks)}")
+
+# ...and the retry installs everything at once
+my_disk.install_package(plugin_manifest)
@@ -1,3 +1,96 @@
+import mmap # Checkpoint images are mapped, not read, so mount cost does not grow with FAT size
+import os
+import struct # Journal record layout
+import threading # Background fsck
+import time # Mount timing
+
+from Codec import get_codec
+from Fat_binary import FatFormatError, FatImage, pack_metadata
+
+# Journal record: op (1 = set, 2 = delete), name length, sector count, then name + uint32 sectors
+JOURNAL_RECORD = struct.Struct("<BHI")
+JOURNAL_SET = 1
+JOURNAL_DELETE = 2
+
+
+class LazyFileAllocationTable:
+    """
+    Dict-like FAT backed by a mapped checkpoint image plus an in-memory overlay
+    for changes made since the checkpoint (the journal tail). Entries are paged
+    in from the image on first access and cached.
+    """
+    def __init__(self, image=None, entries=None):
+        self._image = image
+        self._overlay = entries if entries is not None else {}
+        self._deleted = set()
+
+    def __getitem__(self, name):
+        if name in self._overlay:
+            return self._overlay[name]
+        if name in self._deleted or self._image is None:
+            raise KeyError(name)
+        sectors = self._image.lookup(name)
+        if sectors is None:
+            raise KeyError(name)
+        self._overlay[name] = sectors # Page in once
+        return sectors
+
+    def __setitem__(self, name, sectors):
+        self._deleted.discard(name)
+        self._overlay[name] = sectors
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._overlay.pop(name, None)
+        self._deleted.add(name)
+
+    def __contains__(self, name):
+        try:
+            self[name]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __len__(self):
+        base = len(self._image) if self._image is not None else 0
+        added = sum(1 for name in self._overlay if self._image is None or name not in self._image)
+        removed = sum(1 for name in self._deleted if self._image is not None and name in self._image)
+        return base + added - removed
+
+    def __iter__(self):
+        if self._image is not None:
+            for name in self._image.names():
+                if name not in self._deleted:
+                    yield name
+        for name in list(self._overlay):
+            if self._image is None or name not in self._image:
+                yield name
+
+    def items(self):
+        for name in self:
+            yield name, self[name]
+
+    def entries(self):
+        """Sequential (name, sectors) scan that does not page entries into memory (used by fsck)."""
+        if self._image is not None:
+            for name, sectors in self._image.entries():
+                if name not in self._deleted and name not in self._overlay:
+                    yield name, sectors
+        for name, sectors in list(self._overlay.items()):
+            yield name, sectors
+
+    def paged_in(self):
+        """Number of entries materialized in memory so far."""
+        return len(self._overlay)
+
+
 class PlanetDiskHardDrive:
     """
     A conceptual model of a hard drive (the 'Planet Disk')
@@ -8,17 +101,31 @@ class PlanetDiskHardDrive:
         self.capacity = capacity_gb
         self.interface = "SATA" 
         self.data_blocks = {}
+        self.file_allocation_table = LazyFileAllocationTable()
+        self.next_free_sector = 1
+        self.directories = {} # Directory metadata, parsed lazily from its sector on first access
+        self._checkpoint_path = None
+        self._checkpoint_map = None
+        self._journal = None
+        self._fsck_thread = None
+        self.fsck_report = None
+        self.mount_time_ms = None
         print(f"🚀 Initializing {self.capacity}GB Planet Disk Hard Drive with {self.interface} interface.")
         print("-" * 30)
 
     def text_to_binary(self, text):
         """Converts a string to its 8-bit ASCII binary representation."""
-        return ' '.join(format(ord(char), '08b') for char in text)
+        return get_codec().text_to_binary(text)
+
+    def binary_to_text(self, binary_fragment):
+        """Converts a binary string fragment back to text."""
+        return get_codec().binary_to_text(binary_fragment)
 
     def write_data(self, sector, text_data):
         """Simulates writing text data to a specific sector in binary (The 'Mounting' step)."""
         binary_data = self.text_to_binary(text_data)
         self.data_blocks[sector] = binary_data
+        self.next_free_sector = max(self.next_free_sector, sector + 1)
         print(f"💾 [MOUNT/STORE] Sector {sector} updated with: '{text_data}'")
         print(f"        Binary: {binary_data}")
 
@@ -26,6 +133,209 @@ class PlanetDiskHardDrive:
         """Reads and returns the binary data from a specific sector (The 'Access' step)."""
         return self.data_blocks.get(sector, "00000000 (Empty Sector)")
 
+    # --- NEW FAST MOUNT METHODS ---
+    def update_fat(self, name, sectors):
+        """Updates a FAT entry and appends the change to the journal tail (if mounted)."""
+        self.file_allocation_table[name] = list(sectors)
+        if self._journal is not None:
+            raw = name.encode("utf-8")
+            self._journal.write(JOURNAL_RECORD.pack(JOURNAL_SET, len(raw), len(sectors)) + raw
+                                + struct.pack(f"<{len(sectors)}I", *sectors))
+            self._journal.flush()
+
+    def delete_fat_entry(self, name):
+        """Removes a FAT entry and journals the deletion."""
+        del self.file_allocation_table[name]
+        self.directories.pop(name, None)
+        if self._journal is not None:
+            raw = name.encode("utf-8")
+            self._journal.write(JOURNAL_RECORD.pack(JOURNAL_DELETE, len(raw), 0) + raw)
+            self._journal.flush()
+
+    def read_directory(self, directory_name):
+        """Pages a directory's metadata in from its sector the first time it is accessed."""
+        if directory_name not in self.directories:
+            sectors = self.file_allocation_table.get(directory_name)
+            if not sectors:
+                return None
+            content = self.binary_to_text(self.read_sector(sectors[0]))
+            if not content.startswith("TYPE:DIRECTORY"):
+                return None
+            self.directories[directory_name] = dict(
+                field.split(":", 1) for field in content.split("|")
+            )
+        return self.directories[directory_name]
+
+    def checkpoint(self, path):
+        """
+        Writes a FAT snapshot to 'path' and starts a fresh journal next to it.
+        The snapshot is written to a temporary file and renamed, so a crash never leaves a torn checkpoint.
+        Replaying the old journal over the new snapshot is harmless, so a crash before the
+        journal is truncated loses nothing either.
+        """
+        start = time.perf_counter()
+        entries = dict(self.file_allocation_table.entries())
+        image = pack_metadata(entries)
+        with open(path + ".tmp", "wb") as handle:
+            handle.write(image)
+            handle.flush()
+            os.fsync(handle.fileno())
+        if self._checkpoint_path is not None and os.path.abspath(self._checkpoint_path) == os.path.abspath(path):
+            # The target is mapped by the current mount, and a mapped file cannot be replaced on
+            # Windows: serve the FAT from the entries just written until the remount below
+            self._wait_for_background_fsck()
+            previous_map, self._checkpoint_map = self._checkpoint_map, None
+            self.file_allocation_table = LazyFileAllocationTable(entries=entries)
+            self._release_map(previous_map)
+        os.replace(path + ".tmp", path)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        open(path + ".journal", "wb").close()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"📸 [CHECKPOINT] {len(entries):,} FAT entries -> {path} ({elapsed_ms:.1f} ms)")
+        self.mount(path, fsck=False, quiet=True)
+
+    def _replay_journal(self, path, fat):
+        """
+        Applies the journal tail on top of the mapped snapshot in 'fat'; a torn final record is
+        ignored. Returns the number of records replayed and the highest sector they reference + 1.
+        """
+        replayed = high_water = 0
+        if not os.path.exists(path):
+            return replayed, high_water
+        with open(path, "rb") as handle:
+            journal = handle.read()
+        offset = 0
+        while offset + JOURNAL_RECORD.size <= len(journal):
+            op, name_length, sector_count = JOURNAL_RECORD.unpack_from(journal, offset)
+            end = offset + JOURNAL_RECORD.size + name_length + 4 * sector_count
+            if end > len(journal):
+                break # Torn write at the tail: the change never completed
+            name_start = offset + JOURNAL_RECORD.size
+            name = journal[name_start:name_start + name_length].decode("utf-8")
+            if op == JOURNAL_SET:
+                sectors = list(struct.unpack_from(f"<{sector_count}I", journal, name_start + name_length))
+                fat[name] = sectors
+                if sectors:
+                    high_water = max(high_water, max(sectors) + 1)
+            elif op == JOURNAL_DELETE and name in fat:
+                del fat[name]
+            offset = end
+            replayed += 1
+        return replayed, high_water
+
+    def mount(self, path, fsck=False, quiet=False):
+        """
+        Mounts existing state: maps the checkpointed FAT snapshot, replays the journal tail
+        and defers all entry and directory parsing until first access.
+        Full consistency checking runs only if fsck=True, on a background thread.
+        """
+        start = time.perf_counter()
+        self._wait_for_background_fsck()
+
+        # Build the new state completely before touching the current one, so a bad
+        # checkpoint leaves the existing mount intact
+        handle = open(path, "rb")
+        try:
+            checkpoint_map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            handle.close()
+        try:
+            image = FatImage(checkpoint_map, verify=False) # CRCs are checked by fsck
+            fat = LazyFileAllocationTable(image)
+            replayed, replay_high_water = self._replay_journal(path + ".journal", fat)
+            journal = open(path + ".journal", "ab")
+        except BaseException:
+            fat = image = None
+            self._release_map(checkpoint_map)
+            raise
+
+        previous_map, previous_journal = self._checkpoint_map, self._journal
+        self._checkpoint_map = checkpoint_map
+        self._journal = journal
+        self.file_allocation_table = fat
+        self.directories = {}
+        self._checkpoint_path = path
+        self.next_free_sector = max(self.next_free_sector, image.high_water_sector(), replay_high_water)
+        if previous_journal is not None:
+            previous_journal.close()
+        self._release_map(previous_map)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.mount_time_ms = elapsed_ms
+
+        if not quiet:
+            print(f"🗂️ [MOUNT] {len(image):,} FAT entries mapped, {replayed} journal records replayed "
+                  f"in {elapsed_ms:.1f} ms.")
+        if fsck:
+            self._fsck_thread = threading.Thread(target=self._run_fsck, daemon=True)
+            self._fsck_thread.start()
+        return elapsed_ms
+
+    def _run_fsck(self):
+        """Background consistency check: snapshot CRCs, dangling sectors and cross-linked sectors."""
+        start = time.perf_counter()
+        report = {"crc_ok": True, "entries": 0, "missing_sectors": [], "cross_linked": []}
+        try:
+            FatImage(self._checkpoint_map, verify=True)
+        except FatFormatError as error:
+            report["crc_ok"] = False
+            report["error"] = str(error)
+
+        owners = {}
+        for name, sectors in self.file_allocation_table.entries():
+            report["entries"] += 1
+            for sector in sectors:
+                if sector not in self.data_blocks:
+                    report["missing_sectors"].append((name, sector))
+                if sector in owners:
+                    report["cross_linked"].append((owners[sector], name, sector))
+                owners[sector] = name
+        report["seconds"] = time.perf_counter() - start
+        self.fsck_report = report
+
+    def wait_for_fsck(self):
+        """Blocks until the background fsck finishes and prints its report."""
+        if self._fsck_thread is None:
+            return None
+        self._fsck_thread.join()
+        report = self.fsck_report
+        print(f"\n🩺 [FSCK] {report['entries']:,} entries checked in {report['seconds']:.2f}s | "
+              f"CRC OK: {report['crc_ok']} | Missing sectors: {len(report['missing_sectors'])} | "
+              f"Cross-linked: {len(report['cross_linked'])}")
+        return report
+
+    def _wait_for_background_fsck(self):
+        if self._fsck_thread is not None:
+            self._fsck_thread.join()
+            self._fsck_thread = None
+
+    @staticmethod
+    def _release_map(checkpoint_map):
+        """
+        Closes a checkpoint mapping that the disk no longer uses. If a caller still holds the
+        old FAT (e.g. fat = disk.file_allocation_table), its views keep the mapping alive and
+        it is closed when the last of them goes away instead.
+        """
+        if checkpoint_map is None:
+            return
+        try:
+            checkpoint_map.close()
+        except BufferError:
+            pass
+
+    def unmount(self):
+        """Unmounts the filesystem; the snapshot and journal on the host remain for the next mount."""
+        self._wait_for_background_fsck()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        previous_map, self._checkpoint_map = self._checkpoint_map, None
+        self.file_allocation_table = LazyFileAllocationTable()
+        self.directories = {}
+        self._release_map(previous_map)
+        print("⏏️ [UNMOUNT] File Allocation Table released.")
+
 # --- Hard-Coded Execution Block: "Mounting" the Code ---
 
 def mount_and_access_disk():
@@ -38,7 +348,7 @@ def mount_and_access_disk():
 
     # 2. HARD-CODED DATA WRITING (Writing File System Metadata)
     print("\n--- 2. Hard-Coded Data Writing (Mounting Data) ---")
-    
+
     # Write key terms to fixed, hard-coded sectors
     my_disk.write_data(sector=1, text_data="SATA")
     my_disk.write_data(sector=2, text_data="PATA")
@@ -54,5 +364,39 @@ def mount_and_access_disk():
         binary_data = my_disk.read_sector(sector)
         print(f"🔍 Sector {sector} data: {binary_data}")
 
+    return my_disk
+
+
+def remount_existing_disk(my_disk, file_count=1_000_000):
+    """Checkpoints a large FAT, unmounts, and fast-mounts it again from snapshot + journal."""
+    import tempfile
+
+    print("\n--- 4. Checkpointing a Large File System ---")
+    my_disk.update_fat("PLANET_DISK_LABEL", [3, 4])
+    my_disk.update_fat("teddy_server", [5])
+    my_disk.write_data(sector=5, text_data="TYPE:DIRECTORY|ENTRIES:2|.:5|..:PARENT")
+    for i in range(file_count):
+        my_disk.file_allocation_table[f"teddy_server/logs/log_{i:08d}.txt"] = [1000 + i]
+
+    path = os.path.join(tempfile.gettempdir(), "planet_disk_fat.ckpt")
+    my_disk.checkpoint(path)
+
+    # Changes after the checkpoint only land in the journal tail
+    my_disk.update_fat("teddy_server/config.ini", [6])
+    my_disk.delete_fat_entry("teddy_server/logs/log_00000000.txt")
+    my_disk.unmount()
+
+    print("\n--- 5. Fast Mount (Snapshot + Journal Tail) ---")
+    my_disk.mount(path, fsck=True)
+    print(f"🔍 teddy_server/config.ini -> {my_disk.file_allocation_table.get('teddy_server/config.ini')}")
+    print(f"🔍 log_00424242.txt -> {my_disk.file_allocation_table.get('teddy_server/logs/log_00424242.txt')}")
+    print(f"🔍 Directory 'teddy_server' (paged in lazily): {my_disk.read_directory('teddy_server')}")
+    print(f"   Entries paged into memory: {my_disk.file_allocation_table.paged_in():,}")
+    my_disk.wait_for_fsck() # Every generated log points at an unwritten sector, so fsck flags them
+    my_disk.unmount()
+    os.remove(path)
+    os.remove(path + ".journal")
+
 # Run the hard-coded sequence
-mount_and_access_disk()
+my_disk = mount_and_access_disk()
+remount_existing_disk(my_disk)
@@ -0,0 +1,430 @@
+import multiprocessing # Each shard runs in its own worker process
+from multiprocessing import shared_memory # Bulk sector payloads travel through shared memory
+import random # For simulating attribute changes
+import time # For measuring array throughput
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive used as a single shard of a DiskArray.
+    (Simplified methods from previous responses included for context.)
+    """
+    def __init__(self, capacity_gb, shard_id=0):
+        self.capacity = capacity_gb
+        self.shard_id = shard_id
+        self.data_blocks = {}
+        self.next_free_sector = 1
+        self.failed = False # After a head crash every read fails
+
+        # --- SMART Attributes (Internal State) ---
+        self._power_on_hours = 0
+        self._reallocated_sectors = 0
+        self._spin_retry_count = 0
+        self._temperature = 25 # Starting temp in Celsius
+
+    def _increment_wear(self, activity_level=1):
+        """Simulates disk activity increasing wear and usage."""
+        self._power_on_hours += activity_level
+        self._temperature = max(25, min(40, self._temperature + random.randint(-1, 1)))
+
+    def write_data(self, sector, payload):
+        """Writes a raw stripe unit to a sector and increments wear."""
+        self._increment_wear(activity_level=1)
+        self.data_blocks[sector] = payload
+        self.next_free_sector = max(self.next_free_sector, sector + 1)
+
+    def read_sector(self, sector):
+        """Reads the raw stripe unit stored in a sector (empty if never written, None if unreadable)."""
+        if self.failed:
+            return None
+        return self.data_blocks.get(sector, b"")
+
+    def run_smart_check(self):
+        """Returns the shard's SMART attributes and health score (no printing inside workers)."""
+        health_score = 100
+        if self._reallocated_sectors > 5:
+            health_score -= 30
+        elif self._reallocated_sectors > 0:
+            health_score -= 10
+        if self._temperature > 45:
+            health_score -= 20
+        if self._spin_retry_count > 3:
+            health_score -= 15
+        return {
+            "shard": self.shard_id,
+            "Power-On Hours": self._power_on_hours,
+            "Temperature (°C)": self._temperature,
+            "Reallocated Sector Count": self._reallocated_sectors,
+            "Spin Retry Count": self._spin_retry_count,
+            "health_score": max(0, health_score),
+        }
+
+    def simulate_failure(self):
+        """Simulates a dying platter: sectors become unreadable and SMART attributes spike."""
+        self._reallocated_sectors += 50
+        self._spin_retry_count += 10
+        self._temperature = 60
+        self.data_blocks = {}
+        self.failed = True
+
+
+def _shard_worker(shard_id, capacity_gb, shm_name, conn):
+    """
+    Worker process loop owning one PlanetDiskHardDrive shard.
+    Commands arrive over the pipe; payload bytes are exchanged through the shard's shared memory buffer.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    disk = PlanetDiskHardDrive(capacity_gb, shard_id=shard_id)
+
+    while True:
+        op, args = conn.recv()
+        if op == "write":
+            # args: [(sector, offset, length), ...] describing payloads already placed in the buffer
+            for sector, offset, length in args:
+                disk.write_data(sector, bytes(buf[offset:offset + length]))
+            conn.send(len(args))
+        elif op == "read":
+            # args: [sector, ...]; payloads are packed into the buffer back to back,
+            # unreadable sectors are reported as None instead of being sent as empty units
+            layout = []
+            offset = 0
+            for sector in args:
+                payload = disk.read_sector(sector)
+                if payload is None:
+                    layout.append(None)
+                    continue
+                buf[offset:offset + len(payload)] = payload
+                layout.append((offset, len(payload)))
+                offset += len(payload)
+            conn.send(layout)
+        elif op == "smart":
+            conn.send(disk.run_smart_check())
+        elif op == "fail":
+            disk.simulate_failure()
+            conn.send(True)
+        elif op == "stop":
+            conn.send(True)
+            break
+
+    del buf # Release the memoryview before closing the segment
+    shm.close()
+    conn.close()
+
+
+class DiskArray:
+    """
+    Stripes (RAID-0), mirrors (RAID-1) or stripes with rotating parity (RAID-5)
+    logical blocks across N PlanetDiskHardDrive shards, each in its own worker process.
+    """
+    RAID_LEVELS = (0, 1, 5)
+
+    def __init__(self, shard_count, raid_level=0, stripe_size=4096, capacity_gb=1000,
+                 buffer_size=4 * 1024 * 1024, health_threshold=50):
+        if raid_level not in self.RAID_LEVELS:
+            raise ValueError(f"Unsupported RAID level {raid_level}; choose one of {self.RAID_LEVELS}.")
+        if raid_level == 1 and shard_count < 2:
+            raise ValueError("RAID-1 needs at least 2 shards to mirror.")
+        if raid_level == 5 and shard_count < 3:
+            raise ValueError("RAID-5 needs at least 3 shards (data + rotating parity).")
+        if buffer_size < stripe_size:
+            raise ValueError("Shared memory buffer must hold at least one stripe unit.")
+
+        self.shard_count = shard_count
+        self.raid_level = raid_level
+        self.stripe_size = stripe_size
+        self.capacity = capacity_gb
+        self.buffer_size = buffer_size
+        self.health_threshold = health_threshold
+        self.file_allocation_table = {} # filename -> (start_block, block_count, length)
+        self.next_free_block = 0
+        self.degraded_shards = set()
+
+        self._buffers = []
+        self._conns = []
+        self._workers = []
+        for shard_id in range(shard_count):
+            shm = shared_memory.SharedMemory(create=True, size=buffer_size)
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_shard_worker,
+                args=(shard_id, capacity_gb, shm.name, child_conn),
+                daemon=True,
+            )
+            worker.start()
+            child_conn.close()
+            self._buffers.append(shm)
+            self._conns.append(parent_conn)
+            self._workers.append(worker)
+
+        print(f"======================================================")
+        print(f"🚀 Initializing RAID-{raid_level} Disk Array: {shard_count} x {capacity_gb}GB shards, "
+              f"stripe size {stripe_size} bytes.")
+        print(f"======================================================")
+
+    # --- Block Placement ---
+    def _data_shards_per_row(self):
+        """Number of data units in one stripe row."""
+        if self.raid_level == 0:
+            return self.shard_count
+        if self.raid_level == 1:
+            return 1
+        return self.shard_count - 1
+
+    def _parity_shard(self, row):
+        """Rotating parity placement for RAID-5 (parity moves one shard left per row)."""
+        return (self.shard_count - 1 - row) % self.shard_count
+
+    def _locate(self, block):
+        """Maps a logical block to its list of (shard, sector) placements."""
+        if self.raid_level == 0:
+            return [(block % self.shard_count, block // self.shard_count)]
+        if self.raid_level == 1:
+            return [(shard, block) for shard in range(self.shard_count)]
+        row, index = divmod(block, self.shard_count - 1)
+        parity = self._parity_shard(row)
+        data_shards = [shard for shard in range(self.shard_count) if shard != parity]
+        return [(data_shards[index], row)]
+
+    @staticmethod
+    def _xor(units, size):
+        """XORs equal-length stripe units together (missing units count as zeros)."""
+        acc = 0
+        for unit in units:
+            acc ^= int.from_bytes(unit.ljust(size, b"\x00"), "little")
+        return acc.to_bytes(size, "little")
+
+    # --- Shard I/O (batched, one round trip per shard per buffer-full) ---
+    def _shard_write(self, placements):
+        """Writes {shard: [(sector, payload), ...]} in parallel across all shards."""
+        cursors = {shard: 0 for shard, units in placements.items() if units}
+        while cursors:
+            for shard, cursor in cursors.items():
+                units = placements[shard]
+                buf = self._buffers[shard].buf
+                layout = []
+                offset = 0
+                while cursor < len(units) and offset + len(units[cursor][1]) <= self.buffer_size:
+                    sector, payload = units[cursor]
+                    buf[offset:offset + len(payload)] = payload
+                    layout.append((sector, offset, len(payload)))
+                    offset += len(payload)
+                    cursor += 1
+                cursors[shard] = cursor
+                self._conns[shard].send(("write", layout))
+            for shard in cursors:
+                self._conns[shard].recv()
+            cursors = {shard: cursor for shard, cursor in cursors.items() if cursor < len(placements[shard])}
+
+    def _shard_read(self, requests):
+        """Reads {shard: [sector, ...]} in parallel and returns {(shard, sector): payload}."""
+        per_round = self.buffer_size // self.stripe_size
+        results = {}
+        pending = {shard: list(sectors) for shard, sectors in requests.items() if sectors}
+        while pending:
+            batches = {}
+            for shard, sectors in pending.items():
+                batches[shard] = sectors[:per_round]
+                del sectors[:per_round]
+                self._conns[shard].send(("read", batches[shard]))
+            for shard, batch in batches.items():
+                layout = self._conns[shard].recv()
+                buf = self._buffers[shard].buf
+                for sector, placement in zip(batch, layout):
+                    if placement is None:
+                        results[(shard, sector)] = None
+                        continue
+                    offset, length = placement
+                    results[(shard, sector)] = bytes(buf[offset:offset + length])
+            pending = {shard: sectors for shard, sectors in pending.items() if sectors}
+        return results
+
+    # --- Array Operations ---
+    def write_blocks(self, start_block, data):
+        """
+        Splits data into stripe units starting at start_block and writes them across the shards.
+        RAID-5 rows that are only partially covered are completed with a read-modify-write.
+        Raises IOError before anything is written if a unit would land only on degraded shards
+        with no redundancy left to rebuild it from.
+        """
+        units = [data[i:i + self.stripe_size].ljust(self.stripe_size, b"\x00")
+                 for i in range(0, len(data), self.stripe_size)]
+        placements = {shard: [] for shard in range(self.shard_count)}
+        parity_covers = self.raid_level == 5 and len(self.degraded_shards) <= 1
+
+        for i, unit in enumerate(units):
+            healthy = [(shard, sector) for shard, sector in self._locate(start_block + i)
+                       if shard not in self.degraded_shards]
+            if not healthy and not parity_covers:
+                raise IOError(f"Block {start_block + i} cannot be written: its shard is degraded and "
+                              f"RAID-{self.raid_level} has no redundancy left with {len(self.degraded_shards)} shard(s) down.")
+            for shard, sector in healthy:
+                placements[shard].append((sector, unit))
+
+        if self.raid_level == 5 and units:
+            width = self.shard_count - 1
+            first_row = start_block // width
+            last_row = (start_block + len(units) - 1) // width
+            written = {start_block + i: unit for i, unit in enumerate(units)}
+
+            # Fetch the untouched members of partially covered rows for the parity update
+            missing = [block for row in range(first_row, last_row + 1)
+                       for block in range(row * width, (row + 1) * width) if block not in written]
+            if missing:
+                written.update(zip(missing, self.read_units(missing)))
+
+            for row in range(first_row, last_row + 1):
+                row_units = [written[block] for block in range(row * width, (row + 1) * width)]
+                parity_shard = self._parity_shard(row)
+                if parity_shard not in self.degraded_shards:
+                    placements[parity_shard].append((row, self._xor(row_units, self.stripe_size)))
+
+        self._shard_write(placements)
+        return len(units)
+
+    def read_units(self, blocks):
+        """
+        Reads logical blocks, serving degraded shards from mirrors or parity reconstruction.
+        A shard that reports unreadable sectors is marked degraded on the spot and the read
+        is re-planned around it, so no SMART check is needed before a failure is handled.
+        """
+        blocks = list(blocks)
+        requests = {shard: [] for shard in range(self.shard_count)}
+        plan = []
+        for block in blocks:
+            healthy = [(shard, sector) for shard, sector in self._locate(block)
+                       if shard not in self.degraded_shards]
+            if healthy:
+                shard, sector = healthy[block % len(healthy)] # Spread reads across mirrors
+                requests[shard].append(sector)
+                plan.append(("direct", shard, sector))
+            elif self.raid_level == 5:
+                # Degraded read: every surviving member of the row (data + parity) is XORed
+                shard, row = self._locate(block)[0]
+                survivors = [s for s in range(self.shard_count) if s != shard]
+                if any(s in self.degraded_shards for s in survivors):
+                    raise IOError(f"Block {block} lost: {len(self.degraded_shards)} shards down, RAID-5 tolerates 1.")
+                for survivor in survivors:
+                    requests[survivor].append(row)
+                plan.append(("rebuild", survivors, row))
+            else:
+                raise IOError(f"Block {block} lost: no healthy copy on RAID-{self.raid_level}.")
+
+        payloads = self._shard_read(requests)
+        failed = {shard for (shard, _), payload in payloads.items() if payload is None}
+        if failed:
+            self.degraded_shards |= failed
+            print(f"⚠️ Shard(s) {sorted(failed)} returned unreadable sectors; marked DEGRADED.")
+            return self.read_units(blocks)
+
+        units = []
+        for kind, shard, sector in plan:
+            if kind == "direct":
+                units.append(payloads[(shard, sector)].ljust(self.stripe_size, b"\x00"))
+            else:
+                units.append(self._xor([payloads[(s, sector)] for s in shard], self.stripe_size))
+        return units
+
+    def write_file(self, filename, content):
+        """Writes a whole file as a run of logical blocks and records it in the array FAT."""
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        start_block = self.next_free_block
+        block_count = self.write_blocks(start_block, data)
+        self.file_allocation_table[filename] = (start_block, block_count, len(data))
+        self.next_free_block += block_count
+        print(f"💾 [ARRAY WRITE] {filename}: {len(data)} bytes -> blocks {start_block}..{start_block + block_count - 1}")
+        return block_count
+
+    def read_file(self, filename):
+        """Reads a whole file back from the array (degraded reads are transparent)."""
+        if filename not in self.file_allocation_table:
+            print(f"\n❌ Error: File '{filename}' not found on array.")
+            return None
+        start_block, block_count, length = self.file_allocation_table[filename]
+        units = self.read_units(range(start_block, start_block + block_count))
+        return b"".join(units)[:length]
+
+    def check_health(self):
+        """Runs SMART on every shard in parallel and marks failing shards as degraded."""
+        for conn in self._conns:
+            conn.send(("smart", None))
+        reports = [conn.recv() for conn in self._conns]
+
+        print("\n--- ARRAY SMART REPORT ---")
+        for report in reports:
+            shard = report["shard"]
+            status = "OK"
+            if report["health_score"] < self.health_threshold:
+                self.degraded_shards.add(shard)
+                status = "DEGRADED"
+            print(f"| Shard {shard:<3} | Health: {report['health_score']:>3}/100 | "
+                  f"Reallocated: {report['Reallocated Sector Count']:<4} | {status}")
+
+        tolerated = {0: 0, 1: self.shard_count - 1, 5: 1}[self.raid_level]
+        if len(self.degraded_shards) > tolerated:
+            print(f"❌ **ARRAY FAILED**: {len(self.degraded_shards)} shards down, RAID-{self.raid_level} tolerates {tolerated}.")
+        elif self.degraded_shards:
+            print(f"⚠️ Array running in DEGRADED mode without shards {sorted(self.degraded_shards)}.")
+        return reports
+
+    def simulate_shard_failure(self, shard):
+        """Injects a hardware failure into one shard (its sectors are lost)."""
+        self._conns[shard].send(("fail", None))
+        self._conns[shard].recv()
+        print(f"💥 Shard {shard} suffered a simulated head crash.")
+
+    def shutdown(self):
+        """Stops the worker processes and releases the shared memory buffers."""
+        for conn, worker in zip(self._conns, self._workers):
+            if worker.is_alive():
+                conn.send(("stop", None))
+                conn.recv()
+            worker.join()
+            conn.close()
+        for shm in self._buffers:
+            shm.close()
+            shm.unlink()
+        self._workers = []
+        self._conns = []
+        self._buffers = []
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    # 1. Bulk throughput: one shard vs. one shard per core (RAID-0)
+    payload = bytes(random.getrandbits(8) for _ in range(1024)) * (32 * 1024) # 32 MiB
+    for shards in sorted({1, max(2, multiprocessing.cpu_count())}):
+        array = DiskArray(shard_count=shards, raid_level=0, stripe_size=64 * 1024)
+        start = time.perf_counter()
+        array.write_file("bulk.bin", payload)
+        write_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        assert array.read_file("bulk.bin") == payload
+        read_seconds = time.perf_counter() - start
+        size_mb = len(payload) / (1024 * 1024)
+        print(f"   📈 {shards} shard(s): write {size_mb / write_seconds:.1f} MB/s, read {size_mb / read_seconds:.1f} MB/s")
+        array.shutdown()
+
+    # 2. RAID-5 with a failing shard: reads are reconstructed from parity
+    teddy_log_content = "LOG_START. Server (teddy_server) received command: Connect. Status: OK. Disconnect." * 50
+    array = DiskArray(shard_count=4, raid_level=5, stripe_size=256)
+    array.write_file("teddy_server_log.txt", teddy_log_content)
+    array.simulate_shard_failure(shard=2)
+    recovered = array.read_file("teddy_server_log.txt").decode("utf-8") # Detected on read, before any SMART check
+    print(f"✅ Degraded read matches original: {recovered == teddy_log_content}")
+    array.check_health()
+    array.shutdown()
+
+    # 3. RAID-0 has no redundancy: a lost shard is an error, never silently zero-filled data
+    array = DiskArray(shard_count=3, raid_level=0, stripe_size=256)
+    array.write_file("teddy_server_log.txt", teddy_log_content)
+    array.simulate_shard_failure(shard=1)
+    try:
+        array.read_file("teddy_server_log.txt")
+    except IOError as error:
+        print(f"❌ RAID-0 read failed as expected: {error}")
+    try:
+        array.write_file("teddy_server_log_2.txt", teddy_log_content) # Shard 1 is now known to be degraded
+    except IOError as error:
+        print(f"❌ RAID-0 write refused as expected: {error}")
+    array.shutdown()
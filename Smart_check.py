@@ -1,23 +1,65 @@
+import heapq # Least-worn free sector first
 import random # For simulating attribute changes
+from array import array # Compact per-sector counters
 
 class PlanetDiskHardDrive:
     """
-    Conceptual hard drive with SMART health monitoring.
+    Conceptual hard drive with SMART health monitoring and wear-leveling.
+
+    Logical sectors are mapped to physical sectors. Physical sectors are split into a small
+    hot band [1, hot_region_sectors] and a large outer region behind it. Frequently
+    rewritten data lives in the hot band and moves to the least-worn free sector on every
+    rewrite, where seeks stay short. Cold data is placed in (or migrated to) the outer
+    region, whose outer tracks stream faster and so cost less per access.
     """
-    def __init__(self, capacity_gb):
+    SECTORS_PER_GB = 1024     # Modelled sectors per GB of capacity
+    SEEK_BASE_MS = 4.0        # Settle + rotational latency for any head movement
+    SEEK_PER_SECTOR_MS = 0.01 # Extra cost per sector of distance travelled
+    TRANSFER_MS = {"hot": 0.02, "outer": 0.008} # Per-sector media transfer by region
+
+    def __init__(self, capacity_gb, sector_count=None, hot_region_sectors=256, wear_leveling=True,
+                 hot_threshold=4, cold_threshold=1, decay_interval=1024, sector_endurance=10_000):
+        if sector_count is None:
+            sector_count = int(capacity_gb * self.SECTORS_PER_GB)
+        if sector_count <= hot_region_sectors + 1:
+            raise ValueError(f"{sector_count} sectors leave no outer region behind a {hot_region_sectors}-sector hot band.")
         self.capacity = capacity_gb
-        self.data_blocks = {}
-        self.file_allocation_table = {} 
-        self.next_free_sector = 1 
-        
+        self.data_blocks = {} # Physical sector -> data
+        self.file_allocation_table = {}
+        self.next_free_sector = 1
+
         # --- SMART Attributes (Internal State) ---
         self._power_on_hours = 0
         self._reallocated_sectors = 0
         self._spin_retry_count = 0
         self._temperature = 25 # Starting temp in Celsius
-        
+
+        # --- Wear-Leveling State ---
+        self.sector_count = sector_count
+        self.hot_region_sectors = hot_region_sectors
+        self.wear_leveling = wear_leveling
+        self.hot_threshold = hot_threshold   # Heat at which a logical sector counts as hot
+        self.cold_threshold = cold_threshold # Heat below which hot-band data is migrated out
+        self.decay_interval = decay_interval # Writes between heat halvings
+        self.sector_endurance = sector_endurance # Rated writes per physical sector
+        self.write_counts = array("I", bytes(4 * sector_count)) # Per physical sector
+        self.heat = array("I", bytes(4 * sector_count))         # Per logical sector, decayed
+        self._heated = set() # Logical sectors with non-zero heat, so decay skips the rest
+        self.sector_map = {} # Logical sector -> physical sector
+        self._hot_residents = set() # Logical sectors currently mapped into the hot band
+        self._free = {
+            "hot": [(0, s) for s in range(1, hot_region_sectors + 1)] if wear_leveling else [],
+            "outer": [], # Released outer sectors; the never-used ones start at _outer_frontier
+        } # Heaps of (write count, physical sector)
+        self._outer_frontier = hot_region_sectors + 1
+        self._writes_since_decay = 0
+        self._head = 0
+        self.latency_ms = 0.0
+        self.accesses = 0
+        self.migrations = 0
+
         print(f"======================================================")
-        print(f"🚀 Initializing Planet Disk with SMART Monitoring.")
+        print(f"🚀 Initializing Planet Disk with SMART Monitoring{' and Wear-Leveling' if wear_leveling else ''}.")
         print(f"======================================================")
 
     def _increment_wear(self, activity_level=1):
@@ -28,16 +70,125 @@ class PlanetDiskHardDrive:
             self._reallocated_sectors += 1
         if random.random() < 0.02: # 2% chance of a spin retry event
             self._spin_retry_count += 1
-        
+
+    # --- Latency Model ---
+    def _access(self, physical):
+        """Charges the modelled seek + transfer time for touching one physical sector."""
+        distance = abs(physical - self._head)
+        cost_ms = self.TRANSFER_MS[self._region_of(physical)]
+        if distance > 1:
+            cost_ms += self.SEEK_BASE_MS + self.SEEK_PER_SECTOR_MS * distance
+        self._head = physical
+        self.latency_ms += cost_ms
+        self.accesses += 1
+
+    # --- Physical Placement ---
+    def _region_of(self, physical):
+        return "hot" if physical <= self.hot_region_sectors else "outer"
+
+    def _allocate_physical(self, region):
+        """Pops the least-worn free sector of a region, falling back to the other region when full."""
+        for candidate in (region, "outer" if region == "hot" else "hot"):
+            heap = self._free[candidate]
+            if candidate == "outer" and self._outer_frontier < self.sector_count and (not heap or heap[0][0] > 0):
+                self._outer_frontier += 1 # A never-written sector beats any released one
+                return self._outer_frontier - 1
+            if heap:
+                return heapq.heappop(heap)[1]
+        raise OSError("Planet Disk is full: no free physical sectors left.")
+
+    def _release_physical(self, physical):
+        heapq.heappush(self._free[self._region_of(physical)], (self.write_counts[physical], physical))
+
+    def _program(self, logical, physical, text_data):
+        """The physical write: stores the data, counts the wear and maps the logical sector."""
+        self.data_blocks[physical] = text_data
+        self.write_counts[physical] += 1
+        self._access(physical)
+        self.sector_map[logical] = physical
+        if self._region_of(physical) == "hot":
+            self._hot_residents.add(logical)
+        else:
+            self._hot_residents.discard(logical)
+
+    def _place(self, logical):
+        """Chooses the physical sector for the next write of a logical sector."""
+        current = self.sector_map.get(logical)
+        if not self.wear_leveling:
+            return logical # Identity mapping: rewrites always hammer the same sector
+        region = "hot" if self.heat[logical] >= self.hot_threshold else "outer"
+        if current is not None and region == "outer" and self._region_of(current) == "outer":
+            return current # Cold data stays put
+        # Hot data rotates to the least-worn free hot sector on every rewrite
+        physical = self._allocate_physical(region)
+        if current is not None:
+            self._release_physical(current)
+        return physical
+
     def write_data(self, sector, text_data, status="[WRITE]"):
-        """Writes data to a sector and increments wear."""
+        """Writes data to a logical sector and increments wear."""
+        if not 1 <= sector < self.sector_count:
+            raise ValueError(f"Sector {sector} is outside the {self.sector_count}-sector address space.")
         self._increment_wear(activity_level=1)
-        self.data_blocks[sector] = text_data 
+        self.heat[sector] += 1
+        self._heated.add(sector)
+        self._program(sector, self._place(sector), text_data)
         # ... (simplified print for brevity)
         self.next_free_sector = max(self.next_free_sector, sector + 1)
         # print(f"💾 {status} Sector {sector}...")
 
-    # ... (Other methods like read_sector, create_directory, install_application, etc., would be here)
+        self._writes_since_decay += 1
+        if self._writes_since_decay >= self.decay_interval:
+            self._decay_heat()
+
+    def read_sector(self, sector):
+        """Reads data from a logical sector."""
+        physical = self.sector_map.get(sector)
+        if physical is None:
+            return "RAW DATA ERROR"
+        self._access(physical)
+        return self.data_blocks[physical]
+
+    # --- Hot/Cold Classification ---
+    def _decay_heat(self):
+        """Halves every heat counter, then moves data that cooled down out of the hot band."""
+        self._writes_since_decay = 0
+        for sector in list(self._heated):
+            self.heat[sector] >>= 1
+            if not self.heat[sector]:
+                self._heated.discard(sector)
+        if self.wear_leveling:
+            self.migrate_cold_data()
+
+    def migrate_cold_data(self):
+        """Relocates hot-band data whose heat fell below cold_threshold into the outer region."""
+        moved = 0
+        for logical in [s for s in self._hot_residents if self.heat[s] < self.cold_threshold]:
+            current = self.sector_map[logical]
+            physical = self._allocate_physical("outer")
+            self._access(current)
+            self._program(logical, physical, self.data_blocks.pop(current))
+            self._release_physical(current)
+            moved += 1
+        self.migrations += moved
+        return moved
+
+    def wear_report(self):
+        """Wear distribution over the physical sectors that were ever written."""
+        written = [count for count in self.write_counts if count]
+        if not written:
+            return {"max": 0, "mean": 0.0, "spread": 0.0, "worn_sectors": 0, "life_used_pct": 0.0}
+        mean = sum(written) / len(written)
+        worst = max(written)
+        return {
+            "max": worst,
+            "mean": mean,
+            "spread": worst / mean,
+            "worn_sectors": len(written),
+            "life_used_pct": 100 * worst / self.sector_endurance,
+        }
+
+    # ... (Other methods like create_directory, install_application, etc., would be here)
 
     # --- NEW SMART CHECK METHOD ---
     def run_smart_check(self):
@@ -49,11 +200,16 @@ class PlanetDiskHardDrive:
         print(f"======================================================")
 
         # 1. Gather Attributes
+        wear = self.wear_report()
         attributes = {
             "Power-On Hours": self._power_on_hours,
             "Temperature (°C)": self._temperature,
             "Reallocated Sector Count": self._reallocated_sectors,
             "Spin Retry Count": self._spin_retry_count,
+            "Max Sector Writes": wear["max"],
+            "Wear Spread (max/mean)": f"{wear['spread']:.2f}",
+            "Wear Leveling Life Used": f"{wear['life_used_pct']:.1f}%",
+            "Hot/Cold Migrations": self.migrations,
         }
 
         # 2. Analyze Health Score based on thresholds
@@ -66,20 +222,27 @@ class PlanetDiskHardDrive:
         elif self._reallocated_sectors > 0:
             health_score -= 10
             issues.append("WARNING: Some reallocated sectors detected. Monitor closely.")
-            
+
         if self._temperature > 45:
             health_score -= 20
             issues.append(f"CRITICAL: High operating temperature ({self._temperature}°C). Needs cooling.")
-            
+
         if self._spin_retry_count > 3:
             health_score -= 15
             issues.append(f"WARNING: Multiple spin retries detected ({self._spin_retry_count}). Possible mechanical issue.")
 
+        if wear["life_used_pct"] >= 90:
+            health_score -= 30
+            issues.append(f"CRITICAL: Most-worn sector has used {wear['life_used_pct']:.0f}% of its rated writes.")
+        elif wear["life_used_pct"] >= 50:
+            health_score -= 10
+            issues.append(f"WARNING: Most-worn sector has used {wear['life_used_pct']:.0f}% of its rated writes. Uneven wear.")
+
         # 3. Report Results
         print("\n--- SMART ATTRIBUTES ---")
         for key, value in attributes.items():
             print(f"| {key:<25} | Value: {value}")
-        
+
         print("\n--- HEALTH REPORT ---")
         if issues:
             for issue in issues:
@@ -87,16 +250,39 @@ class PlanetDiskHardDrive:
         else:
             print("   ✅ Disk health is excellent. No critical issues reported.")
 
-        print(f"\nFinal Health Score: **{max(0, health_score)}/100**")
-        
+        health_score = max(0, min(100, health_score))
+        print(f"\nFinal Health Score: **{health_score}/100**")
+        return health_score
+
 
 # --- Execution ---
 
+def run_hot_cold_benchmark(wear_leveling, operations=20_000):
+    """Update-style churn: a few hot config sectors rewritten constantly among scattered cold data."""
+    random.seed(648)
+    disk = PlanetDiskHardDrive(capacity_gb=1000, sector_count=4096, wear_leveling=wear_leveling)
+    hot_sectors = random.sample(range(1, disk.sector_count), 16) # settings.ini of 16 apps
+    cold_sectors = [s for s in range(1, disk.sector_count) if s not in hot_sectors]
+    for sector in hot_sectors + cold_sectors[:2000]:
+        disk.write_data(sector, f"Sector {sector} initial image", status="[INSTALL]")
+    disk.latency_ms, disk.accesses = 0.0, 0 # Measure the steady state only
+
+    for i in range(operations):
+        if i == operations // 2: # Half the apps are retired and new ones take over the churn
+            hot_sectors = hot_sectors[:8] + random.sample(cold_sectors[:2000], 8)
+        if random.random() < 0.9:
+            sector = random.choice(hot_sectors)
+            disk.write_data(sector, f"// CONFIG: version=1.0.{i}; patch_applied=True", status="[CFG UPDATE]")
+            disk.read_sector(sector)
+        else:
+            disk.read_sector(random.choice(cold_sectors[:2000]))
+    return disk
+
 my_disk = PlanetDiskHardDrive(capacity_gb=1000)
 
 # Simulate initial installation (creates directories and writes files)
 # This will call 'write_data' multiple times, increasing wear and hours.
-my_disk.write_data(1, "OS Kernel", status="[OS BOOT]") 
+my_disk.write_data(1, "OS Kernel", status="[OS BOOT]")
 my_disk.write_data(2, "Swap File", status="[OS BOOT]")
 
 # Simulate heavy I/O by performing 50 random write operations
@@ -106,5 +292,18 @@ for i in range(50):
     data = f"Sector {sector} Data Block {i}"
     my_disk.write_data(sector, data, status="[I/O]")
 
+# Update churn: settings.ini (Sector 4) is rewritten on every patch release
+for patch in range(1, 301):
+    my_disk.write_data(4, f"// CONFIG: port=8080; database=production; version=1.0.{patch}; patch_applied=True", status="[CFG UPDATE]")
+
 # Run the health check after the activity
 my_disk.run_smart_check()
+
+# Hot/cold benchmark: in-place rewrites vs. wear-leveled placement
+print("\n--- Hot/Cold Placement Benchmark (20,000 operations, 90% hot) ---")
+results = {mode: run_hot_cold_benchmark(wear_leveling=mode) for mode in (False, True)}
+for mode, disk in results.items():
+    wear = disk.wear_report()
+    print(f"| {'wear-leveled' if mode else 'in-place':<12} | Max sector writes: {wear['max']:>5} "
+          f"| Life used: {wear['life_used_pct']:5.1f}% | Avg access: {disk.latency_ms / disk.accesses:5.2f} ms "
+          f"| Migrations: {disk.migrations}")
@@ -0,0 +1,222 @@
+import time # For showing that snapshot cost does not grow with the FAT
+
+_DELETED = object() # Tombstone: the file was removed in this layer
+
+
+class FatLayer:
+    """
+    One copy-on-write layer of the File Allocation Table. A snapshot freezes the current
+    layer; the live disk continues in a new empty layer whose parent is the frozen one.
+    """
+    def __init__(self, parent=None, name="live"):
+        self.parent = parent
+        self.name = name
+        self.entries = {}
+        self.frozen = False
+
+    def lookup(self, filename):
+        """Resolves a file by walking from this layer towards the oldest snapshot."""
+        layer = self
+        while layer is not None:
+            if filename in layer.entries:
+                chain = layer.entries[filename]
+                return None if chain is _DELETED else chain
+            layer = layer.parent
+        return None
+
+    def names(self):
+        """All visible file names in this view."""
+        seen = {}
+        layer = self
+        while layer is not None:
+            for filename, chain in layer.entries.items():
+                seen.setdefault(filename, chain)
+            layer = layer.parent
+        return [filename for filename, chain in seen.items() if chain is not _DELETED]
+
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive with O(1) whole-disk snapshots using a copy-on-write FAT
+    and per-sector reference counting.
+    (Simplified methods from previous responses included for context.)
+    """
+    def __init__(self, capacity_gb):
+        self.capacity = capacity_gb
+        self.data_blocks = {}
+        self.live = FatLayer()
+        self.snapshots = {}       # snapshot name -> frozen FatLayer
+        self.sector_refcount = {} # sector -> number of FAT layer entries pointing at it
+        self.free_sectors = []    # Reclaimed sectors, reused before growing the disk
+        self.next_free_sector = 1
+        print(f"======================================================")
+        print(f"🚀 Initializing Planet Disk with Copy-on-Write Snapshots.")
+        print(f"======================================================")
+
+    @property
+    def file_allocation_table(self):
+        """Live FAT view as a plain dict (for display only)."""
+        return {filename: self.live.lookup(filename) for filename in self.live.names()}
+
+    def write_data(self, sector, text_data, status="[WRITE]"):
+        """Writes data to a sector."""
+        self.data_blocks[sector] = text_data
+        print(f"💾 {status} Sector {sector}: '{text_data[:60]}...'")
+        self.next_free_sector = max(self.next_free_sector, sector + 1)
+
+    def read_sector(self, sector):
+        """Reads data from a sector."""
+        return self.data_blocks.get(sector, "RAW DATA ERROR")
+
+    # --- Sector Reference Counting ---
+    def _allocate_sector(self):
+        if self.free_sectors:
+            return self.free_sectors.pop()
+        return self.next_free_sector
+
+    def _reference(self, chain):
+        for sector in chain:
+            self.sector_refcount[sector] = self.sector_refcount.get(sector, 0) + 1
+
+    def _release(self, chain):
+        """Drops one reference per sector; sectors nobody references any more are reclaimed."""
+        reclaimed = 0
+        for sector in chain:
+            self.sector_refcount[sector] -= 1
+            if self.sector_refcount[sector] == 0:
+                del self.sector_refcount[sector]
+                self.data_blocks.pop(sector, None)
+                self.free_sectors.append(sector)
+                reclaimed += 1
+        return reclaimed
+
+    # --- Live File Operations (copy-on-write) ---
+    def write_file(self, filename, content, status="[WRITE]"):
+        """
+        Writes a single-sector file. A sector owned only by the live layer is overwritten
+        in place; a sector still shared with a snapshot is never touched (copy-on-write).
+        """
+        own_chain = self.live.entries.get(filename)
+        if own_chain not in (None, _DELETED) and all(self.sector_refcount[s] == 1 for s in own_chain):
+            self.write_data(own_chain[0], content, status=status)
+            return own_chain
+
+        sector = self._allocate_sector()
+        self.write_data(sector, content, status=status + (" [COW]" if self.live.lookup(filename) else ""))
+        if own_chain not in (None, _DELETED):
+            self._release(own_chain)
+        self.live.entries[filename] = [sector]
+        self._reference([sector])
+        return [sector]
+
+    def delete_file(self, filename):
+        """Removes a file from the live view; snapshot copies keep their sectors."""
+        own_chain = self.live.entries.get(filename)
+        if own_chain not in (None, _DELETED):
+            self._release(own_chain)
+        if self.live.parent is not None and self.live.parent.lookup(filename) is not None:
+            self.live.entries[filename] = _DELETED
+        else:
+            self.live.entries.pop(filename, None)
+
+    def read_file(self, filename, snapshot=None):
+        """Reads a file from the live disk or from a snapshot (served from shared sectors, no copy)."""
+        view = self.snapshots[snapshot] if snapshot else self.live
+        chain = view.lookup(filename)
+        if chain is None:
+            return "RAW DATA ERROR"
+        return "".join(self.read_sector(sector) for sector in chain)
+
+    # --- NEW SNAPSHOT METHODS ---
+    def take_snapshot(self, name):
+        """Freezes the live FAT layer as a snapshot in O(1): no FAT entries or sectors are copied."""
+        if name in self.snapshots:
+            print(f"❌ Snapshot '{name}' already exists.")
+            return None
+        start = time.perf_counter()
+        self.live.frozen = True
+        self.live.name = name
+        self.snapshots[name] = self.live
+        self.live = FatLayer(parent=self.live)
+        elapsed_us = (time.perf_counter() - start) * 1_000_000
+        print(f"📸 Snapshot '{name}' taken in {elapsed_us:.1f} µs.")
+        return self.snapshots[name]
+
+    def delete_snapshot(self, name):
+        """
+        Deletes a snapshot by folding its layer into its child. Entries the child already
+        overrides are dropped, and sectors no longer shared with any view are reclaimed.
+        """
+        if name not in self.snapshots:
+            print(f"❌ Snapshot '{name}' not found.")
+            return 0
+        layer = self.snapshots.pop(name)
+
+        child = self.live
+        while child.parent is not layer:
+            child = child.parent
+
+        reclaimed = 0
+        for filename, chain in layer.entries.items():
+            if filename in child.entries:
+                if chain is not _DELETED:
+                    reclaimed += self._release(chain) # Overridden: this copy is now unreachable
+            elif chain is _DELETED and layer.parent is None:
+                continue # Nothing older left to hide
+            else:
+                child.entries[filename] = chain # Still visible through the child: hand it down
+        child.parent = layer.parent
+
+        # A tombstone with nothing left beneath it can be dropped
+        if child.parent is None:
+            for filename in [f for f, chain in child.entries.items() if chain is _DELETED]:
+                del child.entries[filename]
+
+        print(f"🗑️ Snapshot '{name}' deleted; {reclaimed} unshared sector(s) reclaimed.")
+        return reclaimed
+
+    # --- Application Lifecycle (from Installation.py / Update.py) ---
+    def install_application(self, app_name, version):
+        """Simulates initial installation."""
+        root_dir = f"C:/ProgramFiles/{app_name}"
+        self.exe_path = f"{root_dir}/server.exe"
+        self.config_path = f"{root_dir}/config/settings.ini"
+        self.write_file(self.exe_path, f"// Binary executable data for {app_name} v{version}. Start sector reserved.", status="[EXE WRITE]")
+        self.write_file(self.config_path, f"// CONFIG: port=8080; database=production; version={version}", status="[CFG WRITE]")
+        print(f"\n✅ Initial Installation Complete (v{version}).")
+
+    def update_application(self, new_version, snapshot_first=True):
+        """Patches the executable and config, taking a cheap pre-update snapshot first."""
+        if snapshot_first:
+            self.take_snapshot(f"pre-update-{new_version}")
+        self.write_file(self.exe_path, f"// Binary executable data for Teddy_Server v{new_version}. PATCH: Added security layer.", status="[CODE PATCH]")
+        self.write_file(self.config_path, f"// CONFIG: port=8080; database=production; version={new_version}; patch_applied=True", status="[CFG UPDATE]")
+        print(f"\n✅ **UPDATE TO v{new_version} COMPLETE**")
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    my_disk = PlanetDiskHardDrive(capacity_gb=1000)
+
+    # 1. Install, then update behind an automatic snapshot
+    my_disk.install_application(app_name="Teddy_Server", version="1.0.0")
+    my_disk.update_application(new_version="1.1.0")
+
+    # 2. Point-in-time view: the old config is still readable from the snapshot
+    print(f"\n🔍 Live config:     {my_disk.read_file(my_disk.config_path)}")
+    print(f"🔍 Snapshot config: {my_disk.read_file(my_disk.config_path, snapshot='pre-update-1.1.0')}")
+
+    # 3. A second in-place patch touches only live-owned sectors (no extra copies)
+    my_disk.update_application(new_version="1.1.1", snapshot_first=False)
+
+    # 4. Snapshot cost stays constant even with a large FAT
+    for i in range(100_000):
+        my_disk.live.entries[f"teddy_server/logs/log_{i:06d}.txt"] = [1_000_000 + i]
+        my_disk.sector_refcount[1_000_000 + i] = 1
+    my_disk.take_snapshot("large-fat")
+
+    # 5. Deleting the pre-update snapshot frees the v1.0.0 sectors nobody shares any more
+    used_before = len(my_disk.data_blocks)
+    my_disk.delete_snapshot("pre-update-1.1.0")
+    print(f"   Sectors in use: {used_before} -> {len(my_disk.data_blocks)} | Free list: {my_disk.free_sectors}")
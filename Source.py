@@ -1,3 +1,6 @@
+from Codec import get_codec # Whole-buffer binary view conversion
+
+
 class PlanetDiskHardDrive:
     """
     A conceptual model of a hard drive (the 'Planet Disk')
@@ -12,7 +15,7 @@ class PlanetDiskHardDrive:
 
     def text_to_binary(self, text):
         """Converts a string to its 8-bit ASCII binary representation."""
-        return ' '.join(format(ord(char), '08b') for char in text)
+        return get_codec().text_to_binary(text)
 
     def write_data(self, sector, text_data):
         """Simulates writing text data to a specific sector in binary."""
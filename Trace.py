@@ -0,0 +1,239 @@
+import itertools # Cumulative weights for the Zipfian generator
+import random # Synthetic workloads
+import struct # Compact binary trace records
+import time # Recording timestamps and paced replay
+
+# --- Trace File Format (version 2) ---
+#   HEADER  <4sHH    magic 'PDTR', version, flags (bit 0: payloads recorded)
+#   RECORD  <QBIH    time offset (µs), op, sector, payload length, then the payload if recorded
+# Version 1 stored the offset as uint32 µs, which overflows after ~71 minutes; it is still readable.
+TRACE_MAGIC = b"PDTR"
+TRACE_VERSION = 2
+TRACE_HEADER = struct.Struct("<4sHH")
+TRACE_RECORD = struct.Struct("<QBIH")
+_RECORD_BY_VERSION = {1: struct.Struct("<IBIH"), 2: TRACE_RECORD}
+FLAG_PAYLOADS = 1
+
+OP_READ = 1
+OP_WRITE = 2
+OP_SYNC = 3
+OP_NAMES = {OP_READ: "read", OP_WRITE: "write", OP_SYNC: "sync"}
+
+
+def write_trace(path, records, payloads=False):
+    """Writes (time_offset_s, op, sector, payload) records to a binary trace file."""
+    count = 0
+    with open(path, "wb") as handle:
+        handle.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, FLAG_PAYLOADS if payloads else 0))
+        for offset, op, sector, payload in records:
+            raw = payload.encode("utf-8")[:0xFFFF] if payload else b""
+            handle.write(TRACE_RECORD.pack(int(offset * 1_000_000), op, sector, len(raw)))
+            if payloads:
+                handle.write(raw)
+            count += 1
+    return count
+
+
+def read_trace(path):
+    """Yields (time_offset_s, op, sector, payload) from a trace file. Without recorded
+    payloads, writes get a synthetic payload of the original length."""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    magic, version, flags = TRACE_HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC or version not in _RECORD_BY_VERSION:
+        raise ValueError(f"{path} is not a Planet Disk trace (version {version} unsupported).")
+    record = _RECORD_BY_VERSION[version]
+    offset = TRACE_HEADER.size
+    while offset + record.size <= len(data):
+        micros, op, sector, length = record.unpack_from(data, offset)
+        offset += record.size
+        if flags & FLAG_PAYLOADS:
+            payload = data[offset:offset + length].decode("utf-8", errors="replace")
+            offset += length
+        else:
+            payload = "x" * length
+        yield micros / 1_000_000, op, sector, payload
+
+
+class TracingDisk:
+    """
+    Wraps any disk backend (an object with write_data/read_sector) and records every
+    operation it receives; all other attributes pass straight through to the backend.
+    """
+    def __init__(self, backend, record_payloads=False):
+        self.backend = backend
+        self.record_payloads = record_payloads
+        self.records = []
+        self._start = time.perf_counter()
+
+    def _record(self, op, sector, payload=""):
+        self.records.append((time.perf_counter() - self._start, op, sector, payload))
+
+    def write_data(self, sector, text_data, *args, **kwargs):
+        self._record(OP_WRITE, sector, text_data)
+        return self.backend.write_data(sector, text_data, *args, **kwargs)
+
+    def read_sector(self, sector):
+        self._record(OP_READ, sector)
+        return self.backend.read_sector(sector)
+
+    def sync(self):
+        self._record(OP_SYNC, 0)
+        if hasattr(self.backend, "sync"):
+            return self.backend.sync()
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+    def save(self, path):
+        """Writes the recorded operations as a compact binary trace."""
+        count = write_trace(path, self.records, payloads=self.record_payloads)
+        print(f"🎞️ [TRACE] {count:,} operations recorded to {path}")
+        return count
+
+
+def replay(path, backend, speedup=None):
+    """
+    Replays a trace against a backend. speedup=None replays as fast as possible;
+    otherwise inter-arrival times are divided by 'speedup' (2.0 = twice as fast as recorded).
+    Returns throughput and latency percentiles.
+    """
+    latencies = {OP_READ: [], OP_WRITE: [], OP_SYNC: []}
+    start = time.perf_counter()
+    for offset, op, sector, payload in read_trace(path):
+        if speedup:
+            delay = start + offset / speedup - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        issued = time.perf_counter()
+        if op == OP_WRITE:
+            backend.write_data(sector, payload)
+        elif op == OP_READ:
+            backend.read_sector(sector)
+        elif op == OP_SYNC and hasattr(backend, "sync"):
+            backend.sync()
+        latencies[op].append(time.perf_counter() - issued)
+    if hasattr(backend, "sync"):
+        backend.sync()
+    elapsed = time.perf_counter() - start
+
+    operations = sum(len(values) for values in latencies.values())
+    result = {"operations": operations, "seconds": elapsed, "ops_per_second": operations / elapsed if elapsed else 0.0}
+    for op, values in latencies.items():
+        if values:
+            values.sort()
+            result[OP_NAMES[op]] = {
+                "count": len(values),
+                "p50_us": values[len(values) // 2] * 1_000_000,
+                "p99_us": values[min(len(values) - 1, int(len(values) * 0.99))] * 1_000_000,
+            }
+    return result
+
+
+# --- Synthetic Workload Generators ---
+def zipfian_reads(operations, sector_count, skew=1.1, rate=10_000, seed=0):
+    """Reads where a few hot sectors get most of the traffic (Zipf-distributed ranks)."""
+    rng = random.Random(seed)
+    cumulative = list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, sector_count + 1)))
+    sectors = rng.choices(range(1, sector_count + 1), cum_weights=cumulative, k=operations)
+    return [(i / rate, OP_READ, sector, "") for i, sector in enumerate(sectors)]
+
+
+def log_append(operations, start_sector=1000, rate=10_000, sync_every=64):
+    """teddy_server-style log: strictly sequential appends with periodic syncs."""
+    records = []
+    for i in range(operations):
+        records.append((i / rate, OP_WRITE, start_sector + i, f"LOG_LINE {i}. teddy_server heartbeat OK."))
+        if sync_every and (i + 1) % sync_every == 0:
+            records.append((i / rate, OP_SYNC, 0, ""))
+    return records
+
+
+def install_update_churn(applications, updates, rate=10_000, seed=0):
+    """Installs applications (exe + config per app), then repeatedly patches random ones in place."""
+    rng = random.Random(seed)
+    records = []
+    clock = 0
+    for app in range(applications):
+        for kind, sector in (("exe", 2 * app + 1), ("config", 2 * app + 2)):
+            records.append((clock / rate, OP_WRITE, sector, f"// {kind} for app {app} v1.0.0"))
+            clock += 1
+    for update in range(updates):
+        app = rng.randrange(applications)
+        for kind, sector in (("exe", 2 * app + 1), ("config", 2 * app + 2)):
+            records.append((clock / rate, OP_WRITE, sector, f"// {kind} for app {app} v1.0.{update + 1}"))
+            clock += 1
+        records.append((clock / rate, OP_READ, 2 * app + 2, ""))
+        clock += 1
+    return records
+
+
+class PlanetDiskHardDrive:
+    """
+    Minimal reference backend (the original Source.py disk without the binary conversion).
+    """
+    def __init__(self, capacity_gb):
+        self.capacity = capacity_gb
+        self.data_blocks = {}
+
+    def write_data(self, sector, text_data, status="[WRITE]"):
+        self.data_blocks[sector] = text_data
+
+    def read_sector(self, sector):
+        return self.data_blocks.get(sector, "00000000 (Empty Sector)")
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    import Writeback
+
+    trace_dir = tempfile.gettempdir()
+
+    # 1. Record a live session (the Smart_check.py random-write driver) through the tracer
+    random.seed(648)
+    traced = TracingDisk(PlanetDiskHardDrive(capacity_gb=1000), record_payloads=True)
+    traced.write_data(1, "OS Kernel", status="[OS BOOT]")
+    traced.write_data(2, "Swap File", status="[OS BOOT]")
+    for i in range(50):
+        sector = 3 + random.randint(1, 10) + i
+        traced.write_data(sector, f"Sector {sector} Data Block {i}", status="[I/O]")
+        traced.read_sector(sector)
+    traces = {"recorded_session": os.path.join(trace_dir, "recorded_session.pdtr")}
+    traced.save(traces["recorded_session"])
+
+    # 2. Synthetic production-like workloads
+    for name, records in (
+        ("zipfian_reads", zipfian_reads(50_000, sector_count=10_000)),
+        ("log_append", log_append(20_000)),
+        ("install_update_churn", install_update_churn(applications=50, updates=5_000)),
+    ):
+        traces[name] = os.path.join(trace_dir, f"{name}.pdtr")
+        write_trace(traces[name], records)
+        print(f"🎞️ [TRACE] {name}: {len(records):,} operations, {os.path.getsize(traces[name]):,} bytes")
+
+    # 3. Replay every trace against competing configurations
+    print("\n--- Replay Comparison ---")
+    backends = {
+        "reference": lambda: PlanetDiskHardDrive(capacity_gb=1000),
+        "write-through": lambda: Writeback.PlanetDiskHardDrive(capacity_gb=1000, write_back=False),
+        "write-back": lambda: Writeback.PlanetDiskHardDrive(capacity_gb=1000, write_back=True),
+    }
+    results = []
+    for trace_name, path in traces.items():
+        for backend_name, factory in backends.items():
+            backend = factory()
+            result = replay(path, backend)
+            device = getattr(backend, "stats", {}).get("device_requests", "-")
+            results.append((trace_name, backend_name, result, device))
+    for trace_name, backend_name, result, device in results:
+        print(f"| {trace_name:<21} | {backend_name:<13} | {result['ops_per_second']:>10,.0f} ops/s | device requests: {device}")
+
+    # 4. Paced replay: the recorded session at 100x its original speed
+    paced = replay(traces["recorded_session"], PlanetDiskHardDrive(capacity_gb=1000), speedup=100)
+    print(f"\n⏱️ Recorded session replayed at 100x in {paced['seconds'] * 1000:.2f} ms")
+    for path in traces.values():
+        os.remove(path)
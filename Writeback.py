@@ -0,0 +1,184 @@
+import random # For the Smart_check-style random write workload
+import threading # Periodic background flush
+import time # Dirty-data age tracking
+
+
+class PlanetDiskHardDrive:
+    """
+    Conceptual hard drive with a write-back buffer in front of the platter.
+
+    Durability semantics:
+      * write_data() returns once the data is in the buffer; it is visible to read_sector()
+        immediately but is NOT durable yet.
+      * Data becomes durable when a flush writes it out: on sync(), when the buffer holds
+        max_dirty_sectors, when the oldest dirty sector is older than max_age_seconds, or on
+        the optional periodic flusher thread.
+      * write_data(..., sync=True) is write-through: the call returns after the sector is durable.
+      * simulate_power_loss() drops every write that was not flushed.
+    (Simplified methods from previous responses included for context.)
+    """
+    def __init__(self, capacity_gb, max_dirty_sectors=64, max_age_seconds=5.0, write_back=True):
+        self.capacity = capacity_gb
+        self.data_blocks = {} # Durable platter contents
+        self.file_allocation_table = {}
+        self.next_free_sector = 1
+        self.write_back = write_back
+        self.max_dirty_sectors = max_dirty_sectors
+        self.max_age_seconds = max_age_seconds
+
+        self._dirty = {} # sector -> text waiting to be flushed
+        self._oldest_dirty = None
+        self._lock = threading.RLock()
+        self._flusher = None
+        self._stop_flusher = threading.Event()
+
+        self._power_on_hours = 0 # Wear grows per device request, as in Smart_check.py
+        self.stats = {"logical_writes": 0, "absorbed_writes": 0, "device_requests": 0,
+                      "device_sectors": 0, "flushes": 0}
+        self.flush_reasons = {} # 'size' / 'age' / 'sync' -> count
+        print(f"======================================================")
+        mode = "Write-Back" if write_back else "Write-Through"
+        print(f"🚀 Initializing Planet Disk with {mode} Buffering.")
+        print(f"======================================================")
+
+    # --- Device Level ---
+    def _device_write_extent(self, start_sector, payloads):
+        """One device request writing physically adjacent sectors."""
+        for i, text_data in enumerate(payloads):
+            self.data_blocks[start_sector + i] = text_data
+        self._power_on_hours += 1
+        self.stats["device_requests"] += 1
+        self.stats["device_sectors"] += len(payloads)
+
+    # --- Buffered Interface ---
+    def write_data(self, sector, text_data, status="[WRITE]", sync=False):
+        """Buffers a sector write; repeated writes to a dirty sector replace it in place."""
+        with self._lock:
+            self.stats["logical_writes"] += 1
+            self.next_free_sector = max(self.next_free_sector, sector + 1)
+            if not self.write_back:
+                self._device_write_extent(sector, [text_data])
+                return
+            if sector in self._dirty:
+                self.stats["absorbed_writes"] += 1
+            self._dirty[sector] = text_data
+            if self._oldest_dirty is None:
+                self._oldest_dirty = time.monotonic()
+
+            if sync:
+                self.sync()
+            elif len(self._dirty) >= self.max_dirty_sectors:
+                self._flush(reason="size")
+            elif time.monotonic() - self._oldest_dirty >= self.max_age_seconds:
+                self._flush(reason="age")
+
+    def read_sector(self, sector):
+        """Reads data, seeing buffered writes before they reach the platter."""
+        with self._lock:
+            if sector in self._dirty:
+                return self._dirty[sector]
+        return self.data_blocks.get(sector, "RAW DATA ERROR")
+
+    def _flush(self, reason):
+        """Writes all dirty sectors, coalescing adjacent sectors into single extent writes."""
+        if not self._dirty:
+            return 0
+        sectors = sorted(self._dirty)
+        run_start = previous = sectors[0]
+        for sector in sectors[1:] + [None]:
+            if sector is not None and sector == previous + 1:
+                previous = sector
+                continue
+            self._device_write_extent(run_start, [self._dirty[s] for s in range(run_start, previous + 1)])
+            if sector is not None:
+                run_start = previous = sector
+        flushed = len(sectors)
+        self._dirty = {}
+        self._oldest_dirty = None
+        self.stats["flushes"] += 1
+        self.flush_reasons[reason] = self.flush_reasons.get(reason, 0) + 1
+        return flushed
+
+    def sync(self):
+        """Makes every buffered write durable before returning."""
+        with self._lock:
+            return self._flush(reason="sync")
+
+    def start_periodic_flush(self, interval_seconds=1.0):
+        """Starts a background thread that flushes data older than max_age_seconds."""
+        def flusher():
+            while not self._stop_flusher.wait(interval_seconds):
+                with self._lock:
+                    if self._oldest_dirty is not None and time.monotonic() - self._oldest_dirty >= self.max_age_seconds:
+                        self._flush(reason="age")
+        self._stop_flusher.clear()
+        self._flusher = threading.Thread(target=flusher, daemon=True)
+        self._flusher.start()
+
+    def stop_periodic_flush(self):
+        if self._flusher is not None:
+            self._stop_flusher.set()
+            self._flusher.join()
+            self._flusher = None
+
+    def simulate_power_loss(self):
+        """Everything not yet flushed is lost; returns how many sectors were dropped."""
+        with self._lock:
+            lost = len(self._dirty)
+            self._dirty = {}
+            self._oldest_dirty = None
+        print(f"⚡ POWER LOSS: {lost} unflushed sector write(s) lost.")
+        return lost
+
+    def write_amplification_report(self):
+        """Device sectors written per logical sector write (below 1.0 means writes were absorbed)."""
+        stats = self.stats
+        amplification = stats["device_sectors"] / stats["logical_writes"] if stats["logical_writes"] else 0.0
+        print(f"\n--- WRITE BUFFER REPORT ({'write-back' if self.write_back else 'write-through'}) ---")
+        print(f"| {'Logical sector writes':<26} | {stats['logical_writes']}")
+        print(f"| {'Absorbed by buffer':<26} | {stats['absorbed_writes']}")
+        print(f"| {'Device sectors written':<26} | {stats['device_sectors']}")
+        print(f"| {'Device requests':<26} | {stats['device_requests']} in {stats['flushes']} flush(es) {self.flush_reasons}")
+        print(f"| {'Write amplification':<26} | {amplification:.2f}")
+        return amplification
+
+    # --- Workloads from Update.py and Smart_check.py ---
+    def install_application(self, app_name, version):
+        """Simulates initial installation (Setup for Update)."""
+        self.exe_sector = self.next_free_sector
+        self.write_data(self.exe_sector, f"// Binary executable data for {app_name} v{version}.", status="[EXE WRITE]")
+        self.config_sector = self.next_free_sector
+        self.write_data(self.config_sector, f"// CONFIG: port=8080; database=production; version={version}", status="[CFG WRITE]")
+
+    def update_application(self, new_version):
+        """Patches the executable and config in place (the same sectors every time)."""
+        self.write_data(self.exe_sector, f"// Binary executable data for Teddy_Server v{new_version}. PATCH: Added security layer.", status="[CODE PATCH]")
+        self.write_data(self.config_sector, f"// CONFIG: port=8080; database=production; version={new_version}; patch_applied=True", status="[CFG UPDATE]")
+
+
+# --- Execution ---
+
+if __name__ == "__main__":
+    for write_back in (False, True):
+        random.seed(648)
+        my_disk = PlanetDiskHardDrive(capacity_gb=1000, write_back=write_back)
+        my_disk.write_data(1, "OS Kernel", status="[OS BOOT]")
+        my_disk.write_data(2, "Swap File", status="[OS BOOT]")
+
+        # 1. Install, then a burst of patch releases rewriting the same two sectors
+        my_disk.install_application(app_name="Teddy_Server", version="1.0.0")
+        for patch in range(1, 21):
+            my_disk.update_application(new_version=f"1.0.{patch}")
+
+        # 2. The Smart_check.py driver: 50 random writes just past next_free_sector
+        for i in range(50):
+            sector = my_disk.next_free_sector + random.randint(1, 10)
+            my_disk.write_data(sector, f"Sector {sector} Data Block {i}", status="[I/O]")
+
+        my_disk.sync()
+        my_disk.write_amplification_report()
+
+    # 3. Durability: unsynced writes do not survive a power loss
+    my_disk.write_data(3, "// CONFIG: unsynced change")
+    my_disk.simulate_power_loss()
+    print(f"🔍 Sector 3 after power loss: '{my_disk.read_sector(3)}'")
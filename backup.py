@@ -1,87 +1,265 @@
+import threading # Restore runs while foreground I/O continues
+import time # Backup timestamps and restore throughput
+import zlib # CRC32 per-sector checksums, as in Scrub.py
+from concurrent.futures import ThreadPoolExecutor # Parallel verification and restore
+
+BACKUP_PREFIX = "[BACKUP COPY] "
+
+
+def sector_checksum(text_data):
+    """CRC32 of a sector payload."""
+    return zlib.crc32(text_data.encode("utf-8"))
+
+
 class PlanetDiskHardDrive:
     """
-    Conceptual hard drive with backup functionality.
+    Conceptual hard drive with backup functionality and a point-in-time restore engine.
     (Simplified methods from previous responses included for context.)
     """
     def __init__(self, capacity_gb):
         self.capacity = capacity_gb
         self.data_blocks = {}
-        self.file_allocation_table = {} 
-        self.next_free_sector = 1 
+        self.file_allocation_table = {}
+        self.next_free_sector = 1
         self.backup_start_sector = 500 # Hard-coded start for the backup region
         self.backup_sector_map = {}    # Tracks where backups are stored
-        
+        self.backup_manifest = {}      # file path -> (source sector, backup sector, checksum)
+        self.backup_sources = {}       # source sector -> file paths backed up from it
+        self.backup_taken_at = None
+        self.dirty_sectors = set()     # Sectors written or lost since the last backup
+        self._lock = threading.Lock()  # Serialises sector writes between restore workers and foreground I/O
+
         # Internal state needed for backup simulation
         self.exe_path = "C:/ProgramFiles/Teddy_Server/server.exe"
         self.config_path = "C:/ProgramFiles/Teddy_Server/config/settings.ini"
         self.exe_sector = 3
         self.config_sector = 4
-        
+
         # Initialize some data blocks for the backup to find
         self.data_blocks[self.exe_sector] = "// Teddy Server v1.1.0 Executable"
         self.data_blocks[self.config_sector] = "// CONFIG: version=1.1.0"
-        
+        self.file_allocation_table[self.exe_path] = [self.exe_sector]
+        self.file_allocation_table[self.config_path] = [self.config_sector]
+
         print(f"======================================================")
         print(f"🚀 Initializing Planet Disk for Backup.")
         print(f"======================================================")
 
-    def write_data(self, sector, text_data, status="[WRITE]"):
-        """Writes data to a sector."""
-        self.data_blocks[sector] = text_data 
-        print(f"💾 {status} Sector {sector}: '{text_data[:60]}...'")
-        self.next_free_sector = max(self.next_free_sector, sector + 1)
+    def write_data(self, sector, text_data, status="[WRITE]", quiet=False, clean=False):
+        """Writes data to a sector. Unless clean (it now matches the backup), the sector is marked dirty."""
+        with self._lock:
+            self.data_blocks[sector] = text_data
+            self.next_free_sector = max(self.next_free_sector, sector + 1)
+            if clean:
+                self.dirty_sectors.discard(sector)
+            else:
+                self.dirty_sectors.add(sector)
+        if not quiet:
+            print(f"💾 {status} Sector {sector}: '{text_data[:60]}...'")
 
     def read_sector(self, sector):
         """Reads data from a sector."""
         return self.data_blocks.get(sector, "RAW DATA ERROR")
 
+    def _reserve_backup_region(self, sector_count):
+        """
+        Picks where the next backup is written. The hard-coded region is used while it holds
+        nothing but old backup copies; if live data sits there, the backup moves past
+        next_free_sector instead of overwriting it. Copies from the previous backup that fall
+        outside the new region are dropped together with its map.
+        """
+        old_copies = set(self.backup_sector_map.values())
+        start = self.backup_start_sector
+        region = range(start, start + sector_count)
+        if any(sector in self.data_blocks and sector not in old_copies for sector in region):
+            start = self.next_free_sector
+            print(f"   ⚠️ Live data in Sectors {region.start}..{region.stop - 1}; backup region moved to Sector {start}.")
+            self.backup_start_sector = start
+            region = range(start, start + sector_count)
+        with self._lock:
+            for sector in old_copies:
+                if sector not in region:
+                    self.data_blocks.pop(sector, None)
+        return start
+
     # --- NEW BACKUP METHOD ---
-    def run_backup(self):
+    def run_backup(self, files_to_backup=None, quiet=False):
         """
         Simulates creating a copy of critical files in a reserved backup sector range.
+        The manifest records each file's source sector, backup sector and checksum.
         """
         print(f"\n======================================================")
         print("☁️ Initiating FULL BACKUP of Critical Application Data...")
         print(f"======================================================")
-        
-        files_to_backup = {
-            self.exe_path: self.exe_sector,
-            self.config_path: self.config_sector
-        }
-        
-        current_backup_sector = self.backup_start_sector
-        
+
+        if files_to_backup is None:
+            files_to_backup = {
+                self.exe_path: self.exe_sector,
+                self.config_path: self.config_sector
+            }
+
+        current_backup_sector = self._reserve_backup_region(len(files_to_backup))
+        self.backup_manifest = {}
+        self.backup_sources = {}
+        self.backup_sector_map = {}
+
         for file_path, source_sector in files_to_backup.items():
             # 1. READ SOURCE DATA
             source_data = self.read_sector(source_sector)
-            
+
             if source_data == "RAW DATA ERROR":
                 print(f"❌ Backup failed for {file_path}: Source sector {source_sector} read error.")
                 continue
 
             # 2. RESERVE AND WRITE COPY
             backup_sector = current_backup_sector
-            backup_data = f"[BACKUP COPY] {source_data}"
-            
+            backup_data = f"{BACKUP_PREFIX}{source_data}"
+
             self.write_data(
                 sector=backup_sector,
                 text_data=backup_data,
-                status="[BACKUP WRITE]"
+                status="[BACKUP WRITE]",
+                quiet=quiet
             )
-            
+
             # 3. MAP THE BACKUP LOCATION
             self.backup_sector_map[file_path] = backup_sector
-            print(f"   ✅ Backed up '{file_path}' from Sector {source_sector} to **Sector {backup_sector}**.")
-            
+            self.backup_manifest[file_path] = (source_sector, backup_sector, sector_checksum(source_data))
+            self.backup_sources.setdefault(source_sector, []).append(file_path)
+            if not quiet:
+                print(f"   ✅ Backed up '{file_path}' from Sector {source_sector} to **Sector {backup_sector}**.")
+
             current_backup_sector += 1 # Move to the next backup sector
 
+        self.backup_taken_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.dirty_sectors = set()
         print("\n✅ **BACKUP OPERATION COMPLETE**")
-        print(f"   Reserved Backup Map: {self.backup_sector_map}")
-        
-        # Demonstrate recovery readiness by reading a backup copy
-        first_file = list(files_to_backup.keys())[0]
-        backup_location = self.backup_sector_map[first_file]
-        print(f"   Reading backup copy for executable: '{self.read_sector(backup_location)[:35]}...'")
+        print(f"   {len(self.backup_manifest):,} file(s) backed up at {self.backup_taken_at}.")
+
+    # --- NEW RESTORE METHODS ---
+    def _select(self, paths):
+        """Manifest entries for the given files or directory prefixes (all of them for None)."""
+        if paths is None:
+            return list(self.backup_manifest.items())
+        prefixes = tuple(path.rstrip("/") + "/" for path in paths)
+        return [(file_path, entry) for file_path, entry in self.backup_manifest.items()
+                if file_path in paths or file_path.startswith(prefixes)]
+
+    @staticmethod
+    def _batches(items, workers):
+        size = max(1, -(-len(items) // (workers * 4))) # A few batches per worker to even out the load
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _verify_batch(self, batch):
+        """Returns the manifest entries whose backup copy no longer matches its checksum."""
+        bad = []
+        for file_path, (_, backup_sector, checksum) in batch:
+            backup_data = self.read_sector(backup_sector)
+            if not backup_data.startswith(BACKUP_PREFIX) or sector_checksum(backup_data[len(BACKUP_PREFIX):]) != checksum:
+                bad.append(file_path)
+        return bad
+
+    def verify_backup(self, paths=None, workers=4):
+        """Checks every selected backup copy against its manifest checksum across worker threads."""
+        entries = self._select(paths)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            bad = [file_path for result in pool.map(self._verify_batch, self._batches(entries, workers)) for file_path in result]
+        elapsed = time.perf_counter() - start
+        print(f"🔎 [VERIFY] {len(entries):,} backup copies checked in {elapsed:.3f}s | Bad: {len(bad)}")
+        return bad
+
+    def _restore_batch(self, batch, owners, verify=True):
+        """
+        Copies one batch of files back from their backup sectors. Each backup copy is checked
+        against its manifest checksum just before it is used. A file whose old sector now
+        belongs to another file is restored to a fresh sector instead of overwriting it.
+        """
+        restored, relocated, corrupt = 0, 0, []
+        for file_path, (source_sector, backup_sector, checksum) in batch:
+            backup_data = self.read_sector(backup_sector)
+            if verify and (not backup_data.startswith(BACKUP_PREFIX)
+                           or sector_checksum(backup_data[len(BACKUP_PREFIX):]) != checksum):
+                corrupt.append(file_path)
+                continue
+            target = source_sector
+            if owners.get(source_sector, file_path) != file_path:
+                with self._lock:
+                    target = self.next_free_sector
+                    self.next_free_sector += 1
+                    self.backup_manifest[file_path] = (target, backup_sector, checksum)
+                    self.backup_sources[source_sector].remove(file_path)
+                    self.backup_sources.setdefault(target, []).append(file_path)
+                relocated += 1
+            self.write_data(target, backup_data[len(BACKUP_PREFIX):], status="[RESTORE]", quiet=True, clean=True)
+            self.file_allocation_table[file_path] = [target]
+            restored += 1
+        return restored, relocated, corrupt
+
+    def restore(self, paths=None, workers=4, verify=True, skip_matching=True):
+        """
+        Point-in-time restore from the last backup, for selected files / directories or the
+        whole tree. The disk stays online: workers write one sector at a time under the disk
+        lock, so foreground reads and writes interleave with the restore. Only files whose
+        sector was written or lost since the backup are copied back (every selected file when
+        skip_matching is off); the rest just get their mount point checked. Backup copies are
+        verified as they are used, so the restore time tracks the changed data.
+        """
+        entries = self._select(paths)
+        print(f"\n♻️ [RESTORE] {len(entries):,} file(s) to the state of {self.backup_taken_at} using {workers} workers...")
+        start = time.perf_counter()
+        with self._lock:
+            dirty = set(self.dirty_sectors)
+
+        to_copy = []
+        remounted = 0
+        for file_path, entry in entries:
+            source_sector = entry[0]
+            if not skip_matching or source_sector in dirty:
+                to_copy.append((file_path, entry))
+            elif self.file_allocation_table.get(file_path) != [source_sector]:
+                self.file_allocation_table[file_path] = [source_sector]
+                remounted += 1
+
+        # Which live file (if any) owns each sector about to be rewritten
+        wanted = {entry[0] for _, entry in to_copy}
+        owners = {sector: file_path for file_path, sectors in self.file_allocation_table.items()
+                  for sector in sectors if sector in wanted} if wanted else {}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda batch: self._restore_batch(batch, owners, verify),
+                                    self._batches(to_copy, workers)))
+        restored = sum(r for r, _, _ in results)
+        relocated = sum(m for _, m, _ in results)
+        bad = [file_path for _, _, c in results for file_path in c]
+        if bad:
+            print(f"   ⚠️ Skipped {len(bad)} file(s) whose backup copy is corrupt, e.g. '{bad[0]}'.")
+        if relocated:
+            print(f"   ⚠️ {relocated} file(s) restored to fresh sectors; their old sectors now belong to other files.")
+        elapsed = time.perf_counter() - start
+
+        report = {"files": len(entries), "restored": restored, "relocated": relocated,
+                  "remounted": remounted, "skipped": len(entries) - restored - len(bad),
+                  "corrupt_backups": len(bad), "seconds": elapsed,
+                  "files_per_second": len(entries) / elapsed if elapsed else 0.0}
+        print(f"✅ **RESTORE COMPLETE** in {elapsed:.3f}s ({report['files_per_second']:,.0f} files/s) | "
+              f"Rewritten: {restored:,} | Unchanged: {report['skipped']:,} | Corrupt backups: {len(bad)}")
+        return report
+
+    def system_collapse(self):
+        """
+        Simulates catastrophic failure (from Rollback.py): all mount points and the first sectors are lost.
+        """
+        print("\n\n#################################################")
+        print("############ 💥 SYSTEM COLLAPSE INITIATED #############")
+        print("#################################################")
+        self.file_allocation_table = {}
+        with self._lock:
+            for sector in (1, 2, 3, 4):
+                self.data_blocks.pop(sector, None)
+                self.dirty_sectors.add(sector)
+        print("    🗄️ File Allocation Table zeroed out; Sectors 1-4 (OS and application binaries) destroyed.")
 
 
 # --- Execution ---
@@ -90,3 +268,35 @@ my_disk = PlanetDiskHardDrive(capacity_gb=1000)
 
 # Simulate the backup operation
 my_disk.run_backup()
+
+# Demonstrate recovery readiness: collapse, then restore the whole tree
+my_disk.system_collapse()
+my_disk.restore()
+print(f"   Reading restored executable: '{my_disk.read_sector(my_disk.file_allocation_table[my_disk.exe_path][0])[:35]}...'")
+
+# A larger tree: 20,000 log files backed up, then only a handful lost in a collapse
+log_files = {}
+for i in range(20_000):
+    sector = 50_000 + i
+    my_disk.write_data(sector, f"LOG_LINE {i}. teddy_server heartbeat OK.", quiet=True)
+    log_files[f"C:/ProgramFiles/Teddy_Server/logs/log_{i:05d}.txt"] = sector
+my_disk.run_backup({my_disk.exe_path: my_disk.exe_sector, my_disk.config_path: my_disk.config_sector, **log_files}, quiet=True)
+
+my_disk.write_data(50_007, "LOG_LINE 7. overwritten by a runaway process", quiet=True)
+my_disk.system_collapse()
+
+# Before anything is restored, a new file is allocated on the executable's old sector
+hotfix_path = "C:/ProgramFiles/Teddy_Server/hotfix.dll"
+my_disk.write_data(my_disk.exe_sector, "// Teddy Server hotfix 1.1.1", quiet=True)
+my_disk.file_allocation_table[hotfix_path] = [my_disk.exe_sector]
+
+# Selective restore of just the config directory, then the rest of the tree
+my_disk.restore(paths=["C:/ProgramFiles/Teddy_Server/config"])
+my_disk.restore()
+print(f"   Log 7 after restore: '{my_disk.read_sector(50_007)}'")
+print(f"   Executable now in Sector {my_disk.file_allocation_table[my_disk.exe_path][0]}; "
+      f"hotfix still reads '{my_disk.read_sector(my_disk.file_allocation_table[hotfix_path][0])}'")
+
+# For comparison: a restore that blindly copies every sector back
+my_disk.system_collapse()
+my_disk.restore(skip_matching=False)